@@ -1,22 +1,71 @@
 """Setting up pytest fixtures for the tests."""
 
 import json
-from collections.abc import Generator
+from collections.abc import Awaitable, Callable, Generator
+from functools import cache
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
 from aioresponses import aioresponses
+from cryptography.hazmat.primitives.asymmetric.ec import SECP256R1, generate_private_key
 
 from pylamarzocco.const import CUSTOMER_APP_URL
+from pylamarzocco.util import InstallationKey
+
+
+@cache
+def _read_fixture(device_type: str, file_name: str) -> str:
+    """Read a fixture file once per session."""
+    return (Path(__file__).parent / "fixtures" / device_type / file_name).read_text(
+        encoding="utf-8"
+    )
 
 
 def load_fixture(device_type: str, file_name: str) -> dict:
     """Load a fixture."""
-    with open(
-        f"{Path(__file__).parent}/fixtures/{device_type}/{file_name}", encoding="utf-8"
-    ) as f:
-        return json.load(f)
+    # parse on every call so tests are free to mutate what they get back
+    return json.loads(_read_fixture(device_type, file_name))
+
+
+def async_return[T](value: T) -> Callable[..., Awaitable[T]]:
+    """Build a coroutine function resolving to value, for unasserted mocks."""
+
+    async def _return(*args: Any, **kwargs: Any) -> T:
+        return value
+
+    return _return
+
+
+def _not_configured(command: str) -> Callable[..., Awaitable[Any]]:
+    """Build a command that fails the test when it is called."""
+
+    async def _fail(*args: Any, **kwargs: Any) -> Any:
+        pytest.fail(f"Unexpected bluetooth command {command}")
+
+    return _fail
+
+
+class StubBluetoothClient:
+    """Bluetooth client stand-in, tests assign the commands they exercise."""
+
+    def __init__(self) -> None:
+        """Fail the test on any command it did not assign."""
+        self.is_connected = True
+        self.get_machine_capabilities: Callable[..., Awaitable[Any]] = _not_configured(
+            "get_machine_capabilities"
+        )
+        self.get_machine_mode: Callable[..., Awaitable[Any]] = _not_configured(
+            "get_machine_mode"
+        )
+        self.get_boilers: Callable[..., Awaitable[Any]] = _not_configured("get_boilers")
+        self.get_tank_status: Callable[..., Awaitable[Any]] = _not_configured(
+            "get_tank_status"
+        )
+        self.set_power: Callable[..., Awaitable[Any]] = _not_configured("set_power")
+        self.set_steam: Callable[..., Awaitable[Any]] = _not_configured("set_steam")
+        self.set_temp: Callable[..., Awaitable[Any]] = _not_configured("set_temp")
 
 
 @pytest.fixture(name="mock_aioresponse")
@@ -41,6 +90,16 @@ def mock_access_token(mock_aioresponse: aioresponses) -> Generator[AsyncMock]:
     yield AsyncMock()
 
 
+@pytest.fixture(name="installation_key", scope="session")
+def mock_installation_key() -> InstallationKey:
+    """Return an installation key, generating the EC key once per session."""
+    return InstallationKey(
+        secret=bytes(32),
+        private_key=generate_private_key(SECP256R1()),
+        installation_id="mock-installation-id",
+    )
+
+
 @pytest.fixture(name="serial")
 def mock_serial() -> str:
     return "MR123456"
@@ -1,8 +1,10 @@
 """Test the bluetooth client."""
 
 import asyncio
-from collections.abc import Generator
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 from bleak.backends.device import BLEDevice
@@ -13,14 +15,15 @@ from pylamarzocco.const import BoilerType, MachineMode, ModelName, SmartStandByT
 from pylamarzocco.exceptions import BluetoothConnectionFailed
 from pylamarzocco.models import (
     BluetoothBoilerDetails,
+    BluetoothCommandStatus,
     BluetoothMachineCapabilities,
     BluetoothSmartStandbyDetails,
 )
 
 
-@pytest.fixture(name="ble_device")
+@pytest.fixture(name="ble_device", scope="module")
 def ble_device_fixture() -> BLEDevice:
-    """Fixture providing a fake BLE device instance."""
+    """Fixture providing a fake BLE device instance, shared as it is read-only."""
     return BLEDevice(
         address="test-address",
         name="Test Device",
@@ -28,207 +31,249 @@ def ble_device_fixture() -> BLEDevice:
     )
 
 
-@pytest.fixture(name="mock_bleak_client", autouse=True)
-def bleak_client() -> Generator[MagicMock, None, None]:
-    """Fixture to create a mock BleakClient."""
-    with patch(
-        "pylamarzocco.clients._bluetooth.establish_connection",
-        new_callable=AsyncMock,
-    ) as mock_establish_connection:
-        mock_client = MagicMock()
-        mock_client.write_gatt_char = AsyncMock()
-        mock_client.read_gatt_char = AsyncMock(
-            return_value=b'{"id":"test-id","message":"Success","status":"success"}'
-        )
-        mock_client.disconnect = AsyncMock()
-        mock_client.services = MagicMock()
-        mock_establish_connection.return_value = mock_client
-        mock_client.is_connected = True
-        mock_client.services.get_characteristic.return_value = "mock_characteristic"
-        mock_client.establish_mock = mock_establish_connection
-        yield mock_client
-
+async def _noop() -> None:
+    """Stand in for awaitables whose calls are never asserted."""
 
-SETTINGS_CHAR = "0b0b7847-e12b-09a8-b04b-8e0922a9abab"
-AUTH_CHAR = "0d0b7847-e12b-09a8-b04b-8e0922a9abab"
-READ_CHAR = "0a0b7847-e12b-09a8-b04b-8e0922a9abab"
 
+class FakeBleakClient:
+    """Minimal stand-in for a connected BleakClient."""
 
-async def test_ble_set_power(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
-) -> None:
-    """Test setting power on the machine."""
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
-    await client.set_power(True)
-
-    mock_bleak_client.services.get_characteristic.assert_called_with(SETTINGS_CHAR)
-    mock_bleak_client.write_gatt_char.assert_called_with(
-        char_specifier="mock_characteristic",
-        data=b'{"name":"MachineChangeMode","parameter":{"mode":"BrewingMode"}}\x00',
-        response=True,
+    __slots__ = (
+        "clear_cache",
+        "disconnect",
+        "establish_mock",
+        "is_connected",
+        "read_value",
+        "services",
+        "write_gatt_char",
     )
-    await client.disconnect()
-
 
-async def test_ble_set_temperature(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
-) -> None:
-    """Test setting temperature on the machine."""
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
-    await client.set_temp(BoilerType.STEAM, 90)
+    def __init__(self) -> None:
+        """Set up the awaitables the bluetooth client uses."""
+        self.is_connected = True
+        self.services = MagicMock()
+        self.services.get_characteristic.return_value = "mock_characteristic"
+        self.write_gatt_char = AsyncMock()
+        self.read_value = b'{"id":"test-id","message":"Success","status":"success"}'
+        self.disconnect = _noop
+        self.clear_cache = AsyncMock()
+        self.establish_mock = AsyncMock(return_value=self)
 
-    mock_bleak_client.services.get_characteristic.assert_called_with(SETTINGS_CHAR)
-    mock_bleak_client.write_gatt_char.assert_called_with(
-        char_specifier="mock_characteristic",
-        data=b'{"name":"SettingBoilerTarget","parameter":{"identifier":"SteamBoiler","value":90}}\x00',
-        response=True,
-    )
-    await client.disconnect()
+    async def read_gatt_char(self, _char_specifier: str) -> bytes:
+        """Return the configured read value."""
+        return self.read_value
 
 
-async def test_ble_set_smart_standby(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
-) -> None:
-    """Test setting smart standby on the machine."""
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
-    await client.set_smart_standby(True, SmartStandByType.POWER_ON, 42)
-
-    mock_bleak_client.services.get_characteristic.assert_called_with(SETTINGS_CHAR)
-    mock_bleak_client.write_gatt_char.assert_called_with(
-        char_specifier="mock_characteristic",
-        data=b'{"name":"SettingSmartStandby","parameter":{"minutes":42,"mode":"PowerOn","enabled":true}}\x00',
-        response=True,
+@pytest.fixture(name="mock_bleak_client", autouse=True)
+def bleak_client(monkeypatch: pytest.MonkeyPatch) -> FakeBleakClient:
+    """Fixture to create a mock BleakClient."""
+    mock_client = FakeBleakClient()
+    monkeypatch.setattr(
+        "pylamarzocco.clients._bluetooth.establish_connection",
+        mock_client.establish_mock,
     )
-    await client.disconnect()
-
+    return mock_client
 
-async def test_ble_get_machine_capability(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
-) -> None:
-    """Test getting machine capability."""
-    mock_bleak_client.read_gatt_char.return_value = b'[{"family":"MICRA","groupsNumber":1,"coffeeBoilersNumber":1,"hasCupWarmer":false,"steamBoilersNumber":1,"teaDosesNumber":0,"machineModes":["BrewingMode","StandBy"],"schedulingType":"smartWakeUpSleep"}]'
 
+@pytest.fixture(name="client")
+async def client_fixture(
+    ble_device: BLEDevice,
+) -> AsyncGenerator[LaMarzoccoBluetoothClient]:
+    """Fixture providing a bluetooth client that is disconnected on teardown."""
     client = LaMarzoccoBluetoothClient(ble_device, "token")
-    response = await client.get_machine_capabilities()
-
-    mock_bleak_client.services.get_characteristic.assert_called_with(READ_CHAR)
-    mock_bleak_client.write_gatt_char.assert_called_with(
-        char_specifier="mock_characteristic",
-        data=b"machineCapabilities\x00",
-        response=True,
-    )
-    assert response == BluetoothMachineCapabilities(
-        family=ModelName.LINEA_MICRA,
-        groups_number=1,
-        coffee_boilers_number=1,
-        has_cup_warmer=False,
-        steam_boilers_number=1,
-        tea_doses_number=0,
-        machine_modes=[MachineMode.BREWING_MODE, MachineMode.STANDBY],
-        scheduling_type="smartWakeUpSleep",
-    )
+    yield client
     await client.disconnect()
 
 
-async def test_ble_get_boiler_details(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
-) -> None:
-    """Test getting boiler details."""
-    mock_bleak_client.read_gatt_char.return_value = b'[{"id":"SteamBoiler","isEnabled":true,"target":131,"current":45},{"id":"CoffeeBoiler1","isEnabled":true,"target":94,"current":65}]'
+SETTINGS_CHAR = "0b0b7847-e12b-09a8-b04b-8e0922a9abab"
+AUTH_CHAR = "0d0b7847-e12b-09a8-b04b-8e0922a9abab"
+READ_CHAR = "0a0b7847-e12b-09a8-b04b-8e0922a9abab"
 
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
-    response = await client.get_boilers()
 
-    mock_bleak_client.services.get_characteristic.assert_called_with(READ_CHAR)
-    mock_bleak_client.write_gatt_char.assert_called_with(
-        char_specifier="mock_characteristic",
-        data=b"boilers\x00",
-        response=True,
-    )
-    assert response == [
-        BluetoothBoilerDetails(
-            id=BoilerType.STEAM,
-            is_enabled=True,
-            target=131,
-            current=45,
-        ),
-        BluetoothBoilerDetails(
-            id=BoilerType.COFFEE,
-            is_enabled=True,
-            target=94,
-            current=65,
-        ),
-    ]
-    await client.disconnect()
+class JsonPayload:
+    """Match a null-terminated JSON payload by content, not key order."""
 
+    def __init__(self, expected: dict[str, Any]) -> None:
+        """Store the expected decoded payload."""
+        self.expected = expected
 
-async def test_ble_get_smart_standby_details(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
-) -> None:
-    """Test getting smart standby details."""
-    mock_bleak_client.read_gatt_char.return_value = (
-        b'{"mode":"PowerOn","minutes":42,"enabled":"true"}'
-    )
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, bytes) or not other.endswith(b"\x00"):
+            return False
+        return json.loads(other[:-1]) == self.expected
 
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
-    response = await client.get_smart_standby_settings()
+    def __repr__(self) -> str:
+        return f"JsonPayload({self.expected!r})"
 
-    mock_bleak_client.services.get_characteristic.assert_called_with(READ_CHAR)
-    mock_bleak_client.write_gatt_char.assert_called_with(
-        char_specifier="mock_characteristic",
-        data=b"smartStandBy\x00",
-        response=True,
-    )
-    assert response == BluetoothSmartStandbyDetails(
-        mode=SmartStandByType.POWER_ON, minutes=42, enabled=True
-    )
-    await client.disconnect()
 
+EXPECTED_AUTH_CALL = call(
+    char_specifier="mock_characteristic", data=b"token", response=True
+)
 
-async def test_ble_get_tank_status(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
-) -> None:
-    """Test getting tank status."""
-    mock_bleak_client.read_gatt_char.return_value = b'"true"'
+EXPECTED_PAYLOADS: dict[str, bytes | JsonPayload] = {
+    "set_power": JsonPayload(
+        {"name": "MachineChangeMode", "parameter": {"mode": "BrewingMode"}}
+    ),
+    "set_temp": JsonPayload(
+        {
+            "name": "SettingBoilerTarget",
+            "parameter": {"identifier": "SteamBoiler", "value": 90},
+        }
+    ),
+    "set_smart_standby": JsonPayload(
+        {
+            "name": "SettingSmartStandby",
+            "parameter": {"minutes": 42, "mode": "PowerOn", "enabled": True},
+        }
+    ),
+    "get_machine_capabilities": b"machineCapabilities\x00",
+    "get_boilers": b"boilers\x00",
+    "get_smart_standby_settings": b"smartStandBy\x00",
+    "get_tank_status": b"tankStatus\x00",
+    "get_machine_mode": b"machineMode\x00",
+}
+
+EXPECTED_CAPABILITIES = BluetoothMachineCapabilities(
+    family=ModelName.LINEA_MICRA,
+    groups_number=1,
+    coffee_boilers_number=1,
+    has_cup_warmer=False,
+    steam_boilers_number=1,
+    tea_doses_number=0,
+    machine_modes=[MachineMode.BREWING_MODE, MachineMode.STANDBY],
+    scheduling_type="smartWakeUpSleep",
+)
 
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
-    response = await client.get_tank_status()
+EXPECTED_BOILERS = [
+    BluetoothBoilerDetails(
+        id=BoilerType.STEAM,
+        is_enabled=True,
+        target=131,
+        current=45,
+    ),
+    BluetoothBoilerDetails(
+        id=BoilerType.COFFEE,
+        is_enabled=True,
+        target=94,
+        current=65,
+    ),
+]
+
+EXPECTED_SMART_STANDBY = BluetoothSmartStandbyDetails(
+    mode=SmartStandByType.POWER_ON, minutes=42, enabled=True
+)
 
-    mock_bleak_client.services.get_characteristic.assert_called_with(READ_CHAR)
-    mock_bleak_client.write_gatt_char.assert_called_with(
-        char_specifier="mock_characteristic",
-        data=b"tankStatus\x00",
-        response=True,
-    )
-    assert response is True
-    await client.disconnect()
+
+EXPECTED_COMMAND_STATUS = BluetoothCommandStatus(
+    id="test-id", message="Success", status="success"
+)
 
 
-async def test_get_machine_mode(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
+@pytest.mark.parametrize(
+    ("method", "args", "read_value", "characteristic", "data", "expected"),
+    [
+        pytest.param(
+            "set_power",
+            (True,),
+            None,
+            SETTINGS_CHAR,
+            EXPECTED_PAYLOADS["set_power"],
+            EXPECTED_COMMAND_STATUS,
+            id="set_power",
+        ),
+        pytest.param(
+            "set_temp",
+            (BoilerType.STEAM, 90),
+            None,
+            SETTINGS_CHAR,
+            EXPECTED_PAYLOADS["set_temp"],
+            EXPECTED_COMMAND_STATUS,
+            id="set_temp",
+        ),
+        pytest.param(
+            "set_smart_standby",
+            (True, SmartStandByType.POWER_ON, 42),
+            None,
+            SETTINGS_CHAR,
+            EXPECTED_PAYLOADS["set_smart_standby"],
+            EXPECTED_COMMAND_STATUS,
+            id="set_smart_standby",
+        ),
+        pytest.param(
+            "get_machine_capabilities",
+            (),
+            b'[{"family":"MICRA","groupsNumber":1,"coffeeBoilersNumber":1,"hasCupWarmer":false,"steamBoilersNumber":1,"teaDosesNumber":0,"machineModes":["BrewingMode","StandBy"],"schedulingType":"smartWakeUpSleep"}]',
+            READ_CHAR,
+            EXPECTED_PAYLOADS["get_machine_capabilities"],
+            EXPECTED_CAPABILITIES,
+            id="get_machine_capabilities",
+        ),
+        pytest.param(
+            "get_boilers",
+            (),
+            b'[{"id":"SteamBoiler","isEnabled":true,"target":131,"current":45},{"id":"CoffeeBoiler1","isEnabled":true,"target":94,"current":65}]',
+            READ_CHAR,
+            EXPECTED_PAYLOADS["get_boilers"],
+            EXPECTED_BOILERS,
+            id="get_boilers",
+        ),
+        pytest.param(
+            "get_smart_standby_settings",
+            (),
+            b'{"mode":"PowerOn","minutes":42,"enabled":"true"}',
+            READ_CHAR,
+            EXPECTED_PAYLOADS["get_smart_standby_settings"],
+            EXPECTED_SMART_STANDBY,
+            id="get_smart_standby_settings",
+        ),
+        pytest.param(
+            "get_tank_status",
+            (),
+            b'"true"',
+            READ_CHAR,
+            EXPECTED_PAYLOADS["get_tank_status"],
+            True,
+            id="get_tank_status",
+        ),
+        pytest.param(
+            "get_machine_mode",
+            (),
+            b'"BrewingMode"',
+            READ_CHAR,
+            EXPECTED_PAYLOADS["get_machine_mode"],
+            MachineMode.BREWING_MODE,
+            id="get_machine_mode",
+        ),
+    ],
+)
+async def test_ble_command(
+    mock_bleak_client: FakeBleakClient,
+    client: LaMarzoccoBluetoothClient,
+    method: str,
+    args: tuple[Any, ...],
+    read_value: bytes | None,
+    characteristic: str,
+    data: bytes | JsonPayload,
+    expected: Any,
 ) -> None:
-    """Test getting machine mode."""
-    mock_bleak_client.read_gatt_char.return_value = b'"BrewingMode"'
+    """Test the message written for each command and the parsed response."""
+    if read_value is not None:
+        mock_bleak_client.read_value = read_value
 
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
-    response = await client.get_machine_mode()
+    response = await getattr(client, method)(*args)
 
-    mock_bleak_client.services.get_characteristic.assert_called_with(READ_CHAR)
-    mock_bleak_client.write_gatt_char.assert_called_with(
-        char_specifier="mock_characteristic",
-        data=b"machineMode\x00",
-        response=True,
-    )
-    assert response == MachineMode.BREWING_MODE
-    await client.disconnect()
+    mock_bleak_client.services.get_characteristic.assert_called_with(characteristic)
+    assert mock_bleak_client.write_gatt_char.call_args_list == [
+        EXPECTED_AUTH_CALL,
+        call(char_specifier="mock_characteristic", data=data, response=True),
+    ]
+    assert response == expected
 
 
 async def test_persistent_connection_auto_connect(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
+    mock_bleak_client: FakeBleakClient, client: LaMarzoccoBluetoothClient
 ) -> None:
     """Test that connection is established automatically on first command."""
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
-
     # Connection should not be established yet
     assert not client.is_connected
 
@@ -238,16 +283,11 @@ async def test_persistent_connection_auto_connect(
     # Connection should now be established
     mock_bleak_client.establish_mock.assert_awaited_once()
 
-    # Cleanup
-    await client.disconnect()
-
 
 async def test_persistent_connection_reuse(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
+    mock_bleak_client: FakeBleakClient, client: LaMarzoccoBluetoothClient
 ) -> None:
     """Test that connection is reused for multiple commands."""
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
-
     # Execute multiple commands
     await client.set_power(True)
     await client.set_power(False)
@@ -259,67 +299,67 @@ async def test_persistent_connection_reuse(
     # Connection should still be active
     assert client.is_connected
 
-    # Cleanup
-    await client.disconnect()
-
 
 async def test_auto_disconnect_after_idle(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
+    mock_bleak_client: FakeBleakClient,
+    client: LaMarzoccoBluetoothClient,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that connection is automatically disconnected after idle timeout."""
-    # Override the timeout for testing
-    with patch("pylamarzocco.clients._bluetooth.IDLE_TIMEOUT", 0.1):
-        client = LaMarzoccoBluetoothClient(ble_device, "token")
+    # Expire the timer on the next loop iteration instead of sleeping for it
+    monkeypatch.setattr("pylamarzocco.clients._bluetooth.IDLE_TIMEOUT", 0)
+    mock_bleak_client.disconnect = AsyncMock()
 
-        # Execute a command to establish connection
-        await client.set_power(True)
-        assert client.is_connected
+    # Execute a command to establish connection
+    await client.set_power(True)
+    assert client.is_connected
 
-        # Wait for auto-disconnect
-        await asyncio.sleep(0.2)
+    # Wait for auto-disconnect
+    idle_timer = client._disconnect_task  # pylint:disable=W0212
+    assert idle_timer is not None
+    await asyncio.wait([idle_timer])
 
-        # Connection should be closed
-        assert not client.is_connected
-        mock_bleak_client.disconnect.assert_awaited()
+    # Connection should be closed
+    assert not client.is_connected
+    mock_bleak_client.disconnect.assert_awaited()
 
 
 async def test_timer_reset_on_new_command(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
+    mock_bleak_client: FakeBleakClient,
+    client: LaMarzoccoBluetoothClient,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that disconnect timer is reset when a new command is issued."""
-    # Override the timeout for testing
-    with patch("pylamarzocco.clients._bluetooth.IDLE_TIMEOUT", 0.2):
-        client = LaMarzoccoBluetoothClient(ble_device, "token")
-
-        # Execute a command
-        await client.set_power(True)
-        assert client.is_connected
-
-        # Wait a bit but not long enough to disconnect
-        await asyncio.sleep(0.1)
+    monkeypatch.setattr("pylamarzocco.clients._bluetooth.IDLE_TIMEOUT", 0.1)
+    mock_bleak_client.disconnect = AsyncMock()
 
-        # Execute another command (should reset timer)
-        await client.set_steam(True)
-
-        # Wait again
-        await asyncio.sleep(0.1)
+    # Execute a command
+    await client.set_power(True)
+    assert client.is_connected
 
-        # Connection should still be active (timer was reset)
-        assert client.is_connected
+    # Execute another command before the timeout (should reset timer)
+    await asyncio.sleep(0.06)
+    await client.set_steam(True)
 
-        # Wait for disconnect
-        await asyncio.sleep(0.2)
-        assert not client.is_connected
+    # Past the first command's deadline the connection is still active
+    await asyncio.sleep(0.06)
+    assert client.is_connected
+    mock_bleak_client.disconnect.assert_not_awaited()
 
-        # Cleanup
-        await client.disconnect()
+    # Wait for disconnect
+    await asyncio.sleep(0.1)
+    assert not client.is_connected
+    mock_bleak_client.disconnect.assert_awaited_once()
 
 
 async def test_concurrent_commands_thread_safe(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
+    mock_bleak_client: FakeBleakClient, client: LaMarzoccoBluetoothClient
 ) -> None:
     """Test that concurrent commands are handled safely with locks."""
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
+    # Connect up front so the concurrent calls only contend for the lock
+    await client.set_power(True)
+    mock_bleak_client.establish_mock.assert_awaited_once()
+    writes_before = mock_bleak_client.write_gatt_char.await_count
 
     # Execute commands concurrently
     await asyncio.gather(
@@ -328,22 +368,17 @@ async def test_concurrent_commands_thread_safe(
         client.set_power(False),
     )
 
-    # Connection should only be established once despite concurrent calls
+    # The concurrent calls should reuse the connection
     mock_bleak_client.establish_mock.assert_awaited_once()
 
     # All commands should have executed
-    assert mock_bleak_client.write_gatt_char.await_count >= 3
-
-    # Cleanup
-    await client.disconnect()
+    assert mock_bleak_client.write_gatt_char.await_count == writes_before + 3
 
 
 async def test_exception_triggers_disconnect(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
+    mock_bleak_client: FakeBleakClient, client: LaMarzoccoBluetoothClient
 ) -> None:
     """Test that an exception during command execution triggers disconnect."""
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
-
     # First command succeeds to establish connection
     await client.set_power(True)
     assert client.is_connected
@@ -363,14 +398,11 @@ async def test_exception_triggers_disconnect(
 
 
 async def test_characteristic_resolution_failure_clears_cache(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
+    mock_bleak_client: FakeBleakClient, client: LaMarzoccoBluetoothClient
 ) -> None:
     """Test that failing to resolve characteristic clears cache and disconnects."""
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
-
     # Make characteristic resolution fail
     mock_bleak_client.services.get_characteristic.return_value = None
-    mock_bleak_client.clear_cache = AsyncMock()
 
     # Command should fail
     with pytest.raises(BluetoothConnectionFailed):
@@ -383,11 +415,9 @@ async def test_characteristic_resolution_failure_clears_cache(
 
 
 async def test_is_connected_property(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
+    mock_bleak_client: FakeBleakClient, client: LaMarzoccoBluetoothClient
 ) -> None:
     """Test the is_connected property."""
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
-
     # Should not be connected initially
     assert not client.is_connected
 
@@ -401,11 +431,9 @@ async def test_is_connected_property(
 
 
 async def test_reconnect_after_disconnect(
-    mock_bleak_client: MagicMock, ble_device: BLEDevice
+    mock_bleak_client: FakeBleakClient, client: LaMarzoccoBluetoothClient
 ) -> None:
     """Test that client can reconnect after manual disconnect."""
-    client = LaMarzoccoBluetoothClient(ble_device, "token")
-
     # Connect and disconnect
     await client.set_power(True)
     await client.disconnect()
@@ -414,6 +442,3 @@ async def test_reconnect_after_disconnect(
     # Should be able to reconnect
     await client.set_steam(True)
     assert client.is_connected
-
-    # Cleanup
-    await client.disconnect()
@@ -1,8 +1,9 @@
 """Test Bluetooth dashboard functionality."""
 
+from copy import deepcopy
 from datetime import datetime, timezone
-from typing import cast
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any, cast
+from unittest.mock import AsyncMock
 
 import pytest
 from syrupy.assertion import SnapshotAssertion
@@ -20,6 +21,7 @@ from pylamarzocco.const import (
 )
 from pylamarzocco.exceptions import BluetoothConnectionFailed
 from pylamarzocco.models import (
+    BaseWidgetOutput,
     BluetoothBoilerDetails,
     BluetoothCommandStatus,
     BluetoothMachineCapabilities,
@@ -30,108 +32,192 @@ from pylamarzocco.models import (
     SteamBoilerTemperature,
 )
 
+from .conftest import StubBluetoothClient, async_return
+
+_FIXED_DT = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+# Widgets the dashboard starts out with, built once and copied per test
+_DASHBOARD_CONFIG: dict[WidgetType, BaseWidgetOutput] = {
+    WidgetType.CM_MACHINE_STATUS: MachineStatus(
+        status=MachineState.STANDBY,
+        available_modes=[MachineMode.BREWING_MODE, MachineMode.STANDBY],
+        mode=MachineMode.STANDBY,
+        next_status=None,
+        brewing_start_time=None,
+    ),
+    WidgetType.CM_COFFEE_BOILER: CoffeeBoiler(
+        status=BoilerStatus.STAND_BY,
+        enabled=True,
+        enabled_supported=False,
+        target_temperature=93.0,
+        target_temperature_min=80,
+        target_temperature_max=100,
+        target_temperature_step=0.1,
+        ready_start_time=None,
+    ),
+    WidgetType.CM_STEAM_BOILER_LEVEL: SteamBoilerLevel(
+        status=BoilerStatus.STAND_BY,
+        enabled=True,
+        enabled_supported=True,
+        target_level=SteamTargetLevel.LEVEL_1,
+        target_level_supported=True,
+        ready_start_time=None,
+    ),
+    WidgetType.CM_STEAM_BOILER_TEMPERATURE: SteamBoilerTemperature(
+        status=BoilerStatus.STAND_BY,
+        enabled=True,
+        enabled_supported=False,
+        target_temperature=126.0,
+        target_temperature_min=126,
+        target_temperature_max=131,
+        target_temperature_step=1.0,
+        target_temperature_supported=True,
+        ready_start_time=None,
+    ),
+}
+
+# Read-only bluetooth payloads shared by the tests, never mutated
+_CAPS_MICRA = BluetoothMachineCapabilities(
+    family=ModelName.LINEA_MICRA,
+    groups_number=1,
+    coffee_boilers_number=1,
+    has_cup_warmer=False,
+    steam_boilers_number=1,
+    tea_doses_number=0,
+    machine_modes=[MachineMode.BREWING_MODE, MachineMode.STANDBY],
+    scheduling_type="weekly",
+)
+_CAPS_GS3 = BluetoothMachineCapabilities(
+    family=ModelName.GS3,
+    groups_number=3,
+    coffee_boilers_number=2,
+    has_cup_warmer=True,
+    steam_boilers_number=1,
+    tea_doses_number=0,
+    machine_modes=[MachineMode.BREWING_MODE, MachineMode.STANDBY],
+    scheduling_type="weekly",
+)
+_CAPS_MINI = BluetoothMachineCapabilities(
+    family=ModelName.LINEA_MINI,
+    groups_number=1,
+    coffee_boilers_number=1,
+    has_cup_warmer=False,
+    steam_boilers_number=1,
+    tea_doses_number=0,
+    machine_modes=[MachineMode.BREWING_MODE, MachineMode.STANDBY],
+    scheduling_type="weekly",
+)
+_CAPS_MINI_R = BluetoothMachineCapabilities(
+    family=ModelName.LINEA_MINI_R,
+    groups_number=1,
+    coffee_boilers_number=1,
+    has_cup_warmer=True,
+    steam_boilers_number=1,
+    tea_doses_number=0,
+    machine_modes=[MachineMode.BREWING_MODE, MachineMode.STANDBY],
+    scheduling_type="weekly",
+)
+
+_BOILERS_MICRA = [
+    BluetoothBoilerDetails(
+        id=BoilerType.COFFEE,
+        is_enabled=True,
+        target=95,
+        current=94,
+    ),
+    BluetoothBoilerDetails(
+        id=BoilerType.STEAM,
+        is_enabled=False,
+        target=128,
+        current=50,
+    ),
+]
+_BOILERS_GS3 = [
+    BluetoothBoilerDetails(
+        id=BoilerType.COFFEE,
+        is_enabled=True,
+        target=94,
+        current=93,
+    ),
+    BluetoothBoilerDetails(
+        id=BoilerType.STEAM,
+        is_enabled=True,
+        target=128,
+        current=120,
+    ),
+]
+_BOILERS_MINI = [
+    BluetoothBoilerDetails(
+        id=BoilerType.COFFEE,
+        is_enabled=True,
+        target=93,
+        current=92,
+    ),
+    BluetoothBoilerDetails(
+        id=BoilerType.STEAM,
+        is_enabled=True,
+        target=127,
+        current=115,
+    ),
+]
+_BOILERS_MINI_R = [
+    BluetoothBoilerDetails(
+        id=BoilerType.COFFEE,
+        is_enabled=True,
+        target=92,
+        current=91,
+    ),
+    BluetoothBoilerDetails(
+        id=BoilerType.STEAM,
+        is_enabled=True,
+        target=130,
+        current=125,
+    ),
+]
+
+_SUCCESS = BluetoothCommandStatus(id="ble", message="success", status="success")
+_ERROR = BluetoothCommandStatus(id="ble", message="Failed", status="error")
+
 
 @pytest.fixture(name="mock_bluetooth_client")
-def mock_lm_bluetooth_client() -> MagicMock:
+def mock_lm_bluetooth_client() -> StubBluetoothClient:
     """Mock the LaMarzoccoBluetoothClient."""
-    client = MagicMock(spec=LaMarzoccoBluetoothClient)
-    return client
+    return StubBluetoothClient()
 
 
 @pytest.fixture(name="mock_machine_with_dashboard")
 def mock_lm_machine_with_dashboard(
-    mock_bluetooth_client: MagicMock,
+    mock_bluetooth_client: StubBluetoothClient,
 ) -> LaMarzoccoMachine:
     """Mock the LaMarzoccoMachine with dashboard populated."""
     machine = LaMarzoccoMachine(
         serial_number="MR123456",
-        bluetooth_client=mock_bluetooth_client,
+        bluetooth_client=cast(LaMarzoccoBluetoothClient, mock_bluetooth_client),
     )
 
     # Mock the connection_date to a fixed value for snapshot tests
-    machine.dashboard.connection_date = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-
-    # Set up dashboard config with widgets
-    machine.dashboard.config = {
-        WidgetType.CM_MACHINE_STATUS: MachineStatus(
-            status=MachineState.STANDBY,
-            available_modes=[MachineMode.BREWING_MODE, MachineMode.STANDBY],
-            mode=MachineMode.STANDBY,
-            next_status=None,
-            brewing_start_time=None,
-        ),
-        WidgetType.CM_COFFEE_BOILER: CoffeeBoiler(
-            status=BoilerStatus.STAND_BY,
-            enabled=True,
-            enabled_supported=False,
-            target_temperature=93.0,
-            target_temperature_min=80,
-            target_temperature_max=100,
-            target_temperature_step=0.1,
-            ready_start_time=None,
-        ),
-        WidgetType.CM_STEAM_BOILER_LEVEL: SteamBoilerLevel(
-            status=BoilerStatus.STAND_BY,
-            enabled=True,
-            enabled_supported=True,
-            target_level=SteamTargetLevel.LEVEL_1,
-            target_level_supported=True,
-            ready_start_time=None,
-        ),
-        WidgetType.CM_STEAM_BOILER_TEMPERATURE: SteamBoilerTemperature(
-            status=BoilerStatus.STAND_BY,
-            enabled=True,
-            enabled_supported=False,
-            target_temperature=126.0,
-            target_temperature_min=126,
-            target_temperature_max=131,
-            target_temperature_step=1.0,
-            target_temperature_supported=True,
-            ready_start_time=None,
-        ),
-    }
+    machine.dashboard.connection_date = _FIXED_DT
+
+    # Each test mutates the widgets, so hand it its own copy
+    machine.dashboard.config = deepcopy(_DASHBOARD_CONFIG)
 
     return machine
 
 
 async def test_get_dashboard_from_bluetooth(
     mock_machine_with_dashboard: LaMarzoccoMachine,
-    mock_bluetooth_client: MagicMock,
+    mock_bluetooth_client: StubBluetoothClient,
     snapshot: SnapshotAssertion,
 ) -> None:
     """Test filling dashboard from Bluetooth."""
+    config = mock_machine_with_dashboard.dashboard.config
+
     # Set up mock responses
-    mock_bluetooth_client.get_machine_capabilities = AsyncMock(
-        return_value=BluetoothMachineCapabilities(
-            family=ModelName.LINEA_MICRA,
-            groups_number=1,
-            coffee_boilers_number=1,
-            has_cup_warmer=False,
-            steam_boilers_number=1,
-            tea_doses_number=0,
-            machine_modes=[MachineMode.BREWING_MODE, MachineMode.STANDBY],
-            scheduling_type="weekly",
-        )
-    )
+    mock_bluetooth_client.get_machine_capabilities = AsyncMock(return_value=_CAPS_MICRA)
     mock_bluetooth_client.get_machine_mode = AsyncMock(
         return_value=MachineMode.BREWING_MODE
     )
-    mock_bluetooth_client.get_boilers = AsyncMock(
-        return_value=[
-            BluetoothBoilerDetails(
-                id=BoilerType.COFFEE,
-                is_enabled=True,
-                target=95,
-                current=94,
-            ),
-            BluetoothBoilerDetails(
-                id=BoilerType.STEAM,
-                is_enabled=False,
-                target=128,
-                current=50,
-            ),
-        ]
-    )
+    mock_bluetooth_client.get_boilers = AsyncMock(return_value=_BOILERS_MICRA)
     mock_bluetooth_client.get_tank_status = AsyncMock(return_value=True)
 
     await mock_machine_with_dashboard.get_dashboard_from_bluetooth()
@@ -146,68 +232,44 @@ async def test_get_dashboard_from_bluetooth(
     assert mock_machine_with_dashboard.dashboard.to_dict() == snapshot
 
     # Verify dashboard was updated
-    machine_status = cast(
-        MachineStatus,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_MACHINE_STATUS],
-    )
+    machine_status = cast(MachineStatus, config[WidgetType.CM_MACHINE_STATUS])
     assert machine_status.mode == MachineMode.BREWING_MODE
 
-    coffee_boiler = cast(
-        CoffeeBoiler,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_COFFEE_BOILER],
-    )
+    coffee_boiler = cast(CoffeeBoiler, config[WidgetType.CM_COFFEE_BOILER])
     assert coffee_boiler.enabled is True
     assert coffee_boiler.target_temperature == 95.0
 
     # MICRA only has steam level widget, not temperature
-    steam_level = cast(
-        SteamBoilerLevel,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_STEAM_BOILER_LEVEL],
-    )
+    steam_level = cast(SteamBoilerLevel, config[WidgetType.CM_STEAM_BOILER_LEVEL])
     assert steam_level.enabled is False
 
     # MICRA should NOT have steam temperature widget
-    assert (
-        WidgetType.CM_STEAM_BOILER_TEMPERATURE
-        not in mock_machine_with_dashboard.dashboard.config
-    )
+    assert WidgetType.CM_STEAM_BOILER_TEMPERATURE not in config
 
     # Verify tank status widget
-    no_water = cast(
-        NoWater,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_NO_WATER],
-    )
+    no_water = cast(NoWater, config[WidgetType.CM_NO_WATER])
     assert no_water.allarm is False  # Tank status is True, so allarm should be False
 
 
-async def test_get_dashboard_no_bluetooth(
+def test_get_dashboard_no_bluetooth(
     mock_machine_with_dashboard: LaMarzoccoMachine,
 ) -> None:
     """Test filling dashboard without Bluetooth client."""
     mock_machine_with_dashboard._bluetooth_client = None  # pylint:disable=W0212
 
+    # The client check runs before the first await, so no event loop is needed
+    coro = mock_machine_with_dashboard.get_dashboard_from_bluetooth()
     with pytest.raises(BluetoothConnectionFailed):
-        await mock_machine_with_dashboard.get_dashboard_from_bluetooth()
+        coro.send(None)
 
 
 async def test_get_model_info_from_bluetooth(
     mock_machine_with_dashboard: LaMarzoccoMachine,
-    mock_bluetooth_client: MagicMock,
+    mock_bluetooth_client: StubBluetoothClient,
 ) -> None:
     """Test fetching model information from Bluetooth."""
     # Set up mock responses
-    mock_bluetooth_client.get_machine_capabilities = AsyncMock(
-        return_value=BluetoothMachineCapabilities(
-            family=ModelName.GS3,
-            groups_number=3,
-            coffee_boilers_number=2,
-            has_cup_warmer=True,
-            steam_boilers_number=1,
-            tea_doses_number=0,
-            machine_modes=[MachineMode.BREWING_MODE, MachineMode.STANDBY],
-            scheduling_type="weekly",
-        )
-    )
+    mock_bluetooth_client.get_machine_capabilities = AsyncMock(return_value=_CAPS_GS3)
 
     # Call the method to fetch model info
     await mock_machine_with_dashboard.get_model_info_from_bluetooth()
@@ -220,48 +282,69 @@ async def test_get_model_info_from_bluetooth(
     assert mock_machine_with_dashboard.dashboard.model_code == ModelCode.GS3
 
 
+@pytest.mark.parametrize(
+    (
+        "capabilities",
+        "boilers",
+        "model_code",
+        "steam_widget",
+        "missing_widget",
+        "steam_values",
+    ),
+    [
+        pytest.param(
+            _CAPS_MINI_R,
+            _BOILERS_MINI_R,
+            ModelCode.LINEA_MINI_R,
+            WidgetType.CM_STEAM_BOILER_LEVEL,
+            WidgetType.CM_STEAM_BOILER_TEMPERATURE,
+            {"enabled": True},
+            id="linea_mini_r",
+        ),
+        pytest.param(
+            _CAPS_GS3,
+            _BOILERS_GS3,
+            ModelCode.GS3,
+            WidgetType.CM_STEAM_BOILER_TEMPERATURE,
+            WidgetType.CM_STEAM_BOILER_LEVEL,
+            {"enabled": True, "target_temperature": 128.0},
+            id="gs3",
+        ),
+        pytest.param(
+            _CAPS_MINI,
+            _BOILERS_MINI,
+            ModelCode.LINEA_MINI,
+            WidgetType.CM_STEAM_BOILER_TEMPERATURE,
+            WidgetType.CM_STEAM_BOILER_LEVEL,
+            {"enabled": True, "target_temperature": 127.0},
+            id="linea_mini",
+        ),
+    ],
+)
 async def test_get_dashboard_initializes_missing_widgets(
     mock_machine_with_dashboard: LaMarzoccoMachine,
-    mock_bluetooth_client: MagicMock,
+    mock_bluetooth_client: StubBluetoothClient,
     snapshot: SnapshotAssertion,
+    capabilities: BluetoothMachineCapabilities,
+    boilers: list[BluetoothBoilerDetails],
+    model_code: ModelCode,
+    steam_widget: WidgetType,
+    missing_widget: WidgetType,
+    steam_values: dict[str, Any],
 ) -> None:
-    """Test that get_dashboard_from_bluetooth initializes widgets if they don't exist."""
+    """Test that get_dashboard_from_bluetooth initializes widgets per model.
+
+    Only the Linea Mini R and Micra support steam level, the others get the
+    steam temperature widget instead.
+    """
     # Clear the dashboard to simulate widgets not existing
     mock_machine_with_dashboard.dashboard.config.clear()
 
     # Set up mock responses
-    mock_bluetooth_client.get_machine_capabilities = AsyncMock(
-        return_value=BluetoothMachineCapabilities(
-            family=ModelName.LINEA_MINI_R,
-            groups_number=1,
-            coffee_boilers_number=1,
-            has_cup_warmer=True,
-            steam_boilers_number=1,
-            tea_doses_number=0,
-            machine_modes=[MachineMode.BREWING_MODE, MachineMode.STANDBY],
-            scheduling_type="weekly",
-        )
-    )
-    mock_bluetooth_client.get_machine_mode = AsyncMock(
-        return_value=MachineMode.BREWING_MODE
-    )
-    mock_bluetooth_client.get_boilers = AsyncMock(
-        return_value=[
-            BluetoothBoilerDetails(
-                id=BoilerType.COFFEE,
-                is_enabled=True,
-                target=92,
-                current=91,
-            ),
-            BluetoothBoilerDetails(
-                id=BoilerType.STEAM,
-                is_enabled=True,
-                target=130,
-                current=125,
-            ),
-        ]
-    )
-    mock_bluetooth_client.get_tank_status = AsyncMock(return_value=True)
+    mock_bluetooth_client.get_machine_capabilities = async_return(capabilities)
+    mock_bluetooth_client.get_machine_mode = async_return(MachineMode.BREWING_MODE)
+    mock_bluetooth_client.get_boilers = async_return(boilers)
+    mock_bluetooth_client.get_tank_status = async_return(True)
 
     # First fetch model info explicitly
     await mock_machine_with_dashboard.get_model_info_from_bluetooth()
@@ -270,364 +353,179 @@ async def test_get_dashboard_initializes_missing_widgets(
     await mock_machine_with_dashboard.get_dashboard_from_bluetooth()
 
     # Verify model_name and model_code were set from capabilities
-    assert mock_machine_with_dashboard.dashboard.model_name == ModelName.LINEA_MINI_R
-    assert mock_machine_with_dashboard.dashboard.model_code == ModelCode.LINEA_MINI_R
-
-    # Verify widgets were created (Linea Mini R supports steam level, not temperature)
-    assert WidgetType.CM_MACHINE_STATUS in mock_machine_with_dashboard.dashboard.config
-    assert WidgetType.CM_COFFEE_BOILER in mock_machine_with_dashboard.dashboard.config
-    assert (
-        WidgetType.CM_STEAM_BOILER_LEVEL in mock_machine_with_dashboard.dashboard.config
-    )
-    assert (
-        WidgetType.CM_STEAM_BOILER_TEMPERATURE
-        not in mock_machine_with_dashboard.dashboard.config
-    )
+    assert mock_machine_with_dashboard.dashboard.model_name == capabilities.family
+    assert mock_machine_with_dashboard.dashboard.model_code == model_code
+
+    # Verify only the steam widget matching the model was created
+    config = mock_machine_with_dashboard.dashboard.config
+    assert {
+        WidgetType.CM_MACHINE_STATUS,
+        WidgetType.CM_COFFEE_BOILER,
+        steam_widget,
+    } <= config.keys()
+    assert missing_widget not in config
 
     # Verify widgets have correct values from Bluetooth
+    steam = config[steam_widget]
+    assert {key: getattr(steam, key) for key in steam_values} == steam_values
     assert mock_machine_with_dashboard.dashboard.to_dict() == snapshot
 
 
-async def test_get_dashboard_without_steam_level_support(
-    mock_machine_with_dashboard: LaMarzoccoMachine,
-    mock_bluetooth_client: MagicMock,
-) -> None:
-    """Test that models without steam level support only get temperature widget."""
-    # Clear the dashboard to simulate widgets not existing
-    mock_machine_with_dashboard.dashboard.config.clear()
-
-    # Set up mock responses for GS3 (does not support steam level)
-    mock_bluetooth_client.get_machine_capabilities = AsyncMock(
-        return_value=BluetoothMachineCapabilities(
-            family=ModelName.GS3,
-            groups_number=3,
-            coffee_boilers_number=2,
-            has_cup_warmer=True,
-            steam_boilers_number=1,
-            tea_doses_number=0,
-            machine_modes=[MachineMode.BREWING_MODE, MachineMode.STANDBY],
-            scheduling_type="weekly",
-        )
-    )
-    mock_bluetooth_client.get_machine_mode = AsyncMock(
-        return_value=MachineMode.BREWING_MODE
-    )
-    mock_bluetooth_client.get_boilers = AsyncMock(
-        return_value=[
-            BluetoothBoilerDetails(
-                id=BoilerType.COFFEE,
-                is_enabled=True,
-                target=94,
-                current=93,
-            ),
-            BluetoothBoilerDetails(
-                id=BoilerType.STEAM,
-                is_enabled=True,
-                target=128,
-                current=120,
-            ),
-        ]
-    )
-    mock_bluetooth_client.get_tank_status = AsyncMock(return_value=True)
-
-    # First fetch model info explicitly
-    await mock_machine_with_dashboard.get_model_info_from_bluetooth()
-
-    # Then get dashboard
-    await mock_machine_with_dashboard.get_dashboard_from_bluetooth()
-
-    # Verify model_name and model_code were set from capabilities
-    assert mock_machine_with_dashboard.dashboard.model_name == ModelName.GS3
-    assert mock_machine_with_dashboard.dashboard.model_code == ModelCode.GS3
-
-    # Verify widgets were created - GS3 should NOT have steam level widget
-    assert WidgetType.CM_MACHINE_STATUS in mock_machine_with_dashboard.dashboard.config
-    assert WidgetType.CM_COFFEE_BOILER in mock_machine_with_dashboard.dashboard.config
-    assert (
-        WidgetType.CM_STEAM_BOILER_LEVEL
-        not in mock_machine_with_dashboard.dashboard.config
-    )
-    assert (
-        WidgetType.CM_STEAM_BOILER_TEMPERATURE
-        in mock_machine_with_dashboard.dashboard.config
-    )
-
-    # Verify temperature widget has correct values
-    steam_temp = cast(
-        SteamBoilerTemperature,
-        mock_machine_with_dashboard.dashboard.config[
-            WidgetType.CM_STEAM_BOILER_TEMPERATURE
-        ],
-    )
-    assert steam_temp.enabled is True
-    assert steam_temp.target_temperature == 128.0
-
-
-async def test_get_dashboard_mini_original_temperature_only(
-    mock_machine_with_dashboard: LaMarzoccoMachine,
-    mock_bluetooth_client: MagicMock,
-) -> None:
-    """Test that original Linea Mini (without R) only gets temperature widget."""
-    # Clear the dashboard to simulate widgets not existing
-    mock_machine_with_dashboard.dashboard.config.clear()
-
-    # Set up mock responses for original Linea Mini
-    mock_bluetooth_client.get_machine_capabilities = AsyncMock(
-        return_value=BluetoothMachineCapabilities(
-            family=ModelName.LINEA_MINI,
-            groups_number=1,
-            coffee_boilers_number=1,
-            has_cup_warmer=False,
-            steam_boilers_number=1,
-            tea_doses_number=0,
-            machine_modes=[MachineMode.BREWING_MODE, MachineMode.STANDBY],
-            scheduling_type="weekly",
-        )
-    )
-    mock_bluetooth_client.get_machine_mode = AsyncMock(
-        return_value=MachineMode.BREWING_MODE
-    )
-    mock_bluetooth_client.get_boilers = AsyncMock(
-        return_value=[
-            BluetoothBoilerDetails(
-                id=BoilerType.COFFEE,
-                is_enabled=True,
-                target=93,
-                current=92,
-            ),
-            BluetoothBoilerDetails(
-                id=BoilerType.STEAM,
-                is_enabled=True,
-                target=127,
-                current=115,
-            ),
-        ]
-    )
-    mock_bluetooth_client.get_tank_status = AsyncMock(return_value=True)
-
-    # First fetch model info explicitly
-    await mock_machine_with_dashboard.get_model_info_from_bluetooth()
-
-    # Then get dashboard
-    await mock_machine_with_dashboard.get_dashboard_from_bluetooth()
-
-    # Verify model_name and model_code were set from capabilities
-    assert mock_machine_with_dashboard.dashboard.model_name == ModelName.LINEA_MINI
-    assert mock_machine_with_dashboard.dashboard.model_code == ModelCode.LINEA_MINI
-
-    # Verify widgets - original Mini should NOT have steam level, only temperature
-    assert WidgetType.CM_MACHINE_STATUS in mock_machine_with_dashboard.dashboard.config
-    assert WidgetType.CM_COFFEE_BOILER in mock_machine_with_dashboard.dashboard.config
-    assert (
-        WidgetType.CM_STEAM_BOILER_LEVEL
-        not in mock_machine_with_dashboard.dashboard.config
-    )
-    assert (
-        WidgetType.CM_STEAM_BOILER_TEMPERATURE
-        in mock_machine_with_dashboard.dashboard.config
-    )
-
-    # Verify temperature widget has correct values
-    steam_temp = cast(
-        SteamBoilerTemperature,
-        mock_machine_with_dashboard.dashboard.config[
-            WidgetType.CM_STEAM_BOILER_TEMPERATURE
-        ],
-    )
-    assert steam_temp.enabled is True
-    assert steam_temp.target_temperature == 127.0
-
-
-async def test_set_power_updates_dashboard(
-    mock_machine_with_dashboard: LaMarzoccoMachine,
-    mock_bluetooth_client: MagicMock,
-    snapshot: SnapshotAssertion,
-) -> None:
-    """Test that set_power updates dashboard on success."""
-    mock_bluetooth_client.set_power = AsyncMock(
-        return_value=BluetoothCommandStatus(
-            id="ble", message="power on", status="success"
-        )
-    )
-
-    result = await mock_machine_with_dashboard.set_power(True)
-
-    assert result is True
-    machine_status = cast(
-        MachineStatus,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_MACHINE_STATUS],
-    )
-    assert machine_status.mode == MachineMode.BREWING_MODE
-    assert machine_status.to_dict() == snapshot
-
-
-async def test_set_power_off_updates_dashboard(
-    mock_machine_with_dashboard: LaMarzoccoMachine,
-    mock_bluetooth_client: MagicMock,
-) -> None:
-    """Test that set_power(False) updates dashboard on success."""
-    # First set to brewing mode
-    machine_status_temp = cast(
-        MachineStatus,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_MACHINE_STATUS],
-    )
-    machine_status_temp.mode = MachineMode.BREWING_MODE
-
-    mock_bluetooth_client.set_power = AsyncMock(
-        return_value=BluetoothCommandStatus(
-            id="ble", message="power on", status="success"
-        )
-    )
-
-    result = await mock_machine_with_dashboard.set_power(False)
-
-    assert result is True
-    machine_status = cast(
-        MachineStatus,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_MACHINE_STATUS],
-    )
-    assert machine_status.mode == MachineMode.STANDBY
-
-
-async def test_set_steam_updates_dashboard(
-    mock_machine_with_dashboard: LaMarzoccoMachine,
-    mock_bluetooth_client: MagicMock,
-) -> None:
-    """Test that set_steam updates dashboard on success."""
-    mock_bluetooth_client.set_steam = AsyncMock(
-        return_value=BluetoothCommandStatus(
-            id="ble", message="boiler enable success", status="success"
-        )
-    )
-
-    result = await mock_machine_with_dashboard.set_steam(False)
-
-    assert result is True
-    steam_level = cast(
-        SteamBoilerLevel,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_STEAM_BOILER_LEVEL],
-    )
-    assert steam_level.enabled is False
-
-
-async def test_set_coffee_temp_updates_dashboard(
-    mock_machine_with_dashboard: LaMarzoccoMachine,
-    mock_bluetooth_client: MagicMock,
-    snapshot: SnapshotAssertion,
-) -> None:
-    """Test that set_coffee_target_temperature updates dashboard on success."""
-    mock_bluetooth_client.set_temp = AsyncMock(
-        return_value=BluetoothCommandStatus(
-            id="ble", message="Setting Temperature Success", status="success"
-        )
-    )
-
-    result = await mock_machine_with_dashboard.set_coffee_target_temperature(96.5)
-
-    assert result is True
-    coffee_boiler = cast(
-        CoffeeBoiler,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_COFFEE_BOILER],
-    )
-    assert coffee_boiler.target_temperature == 96.5
-    assert coffee_boiler.to_dict() == snapshot
-
-
-async def test_set_steam_level_updates_dashboard(
+@pytest.mark.parametrize(
+    (
+        "method",
+        "args",
+        "command",
+        "model_code",
+        "widget",
+        "attribute",
+        "initial",
+        "expected",
+    ),
+    [
+        pytest.param(
+            "set_power",
+            (True,),
+            "set_power",
+            ModelCode.LINEA_MICRA,
+            WidgetType.CM_MACHINE_STATUS,
+            "mode",
+            MachineMode.STANDBY,
+            MachineMode.BREWING_MODE,
+            id="power_on",
+        ),
+        pytest.param(
+            "set_power",
+            (False,),
+            "set_power",
+            ModelCode.LINEA_MICRA,
+            WidgetType.CM_MACHINE_STATUS,
+            "mode",
+            MachineMode.BREWING_MODE,
+            MachineMode.STANDBY,
+            id="power_off",
+        ),
+        pytest.param(
+            "set_steam",
+            (False,),
+            "set_steam",
+            ModelCode.LINEA_MICRA,
+            WidgetType.CM_STEAM_BOILER_LEVEL,
+            "enabled",
+            True,
+            False,
+            id="steam",
+        ),
+        pytest.param(
+            "set_coffee_target_temperature",
+            (96.5,),
+            "set_temp",
+            ModelCode.LINEA_MICRA,
+            WidgetType.CM_COFFEE_BOILER,
+            "target_temperature",
+            93.0,
+            96.5,
+            id="coffee_temp",
+        ),
+        pytest.param(
+            "set_steam_level",
+            (SteamTargetLevel.LEVEL_3,),
+            "set_temp",
+            ModelCode.LINEA_MICRA,
+            WidgetType.CM_STEAM_BOILER_LEVEL,
+            "target_level",
+            SteamTargetLevel.LEVEL_1,
+            SteamTargetLevel.LEVEL_3,
+            id="steam_level",
+        ),
+        pytest.param(
+            "set_steam_target_temperature",
+            (122.5,),
+            "set_temp",
+            ModelCode.GS3,
+            WidgetType.CM_STEAM_BOILER_TEMPERATURE,
+            "target_temperature",
+            126.0,
+            122.5,
+            id="steam_temp",
+        ),
+    ],
+)
+async def test_set_command_updates_dashboard(
     mock_machine_with_dashboard: LaMarzoccoMachine,
-    mock_bluetooth_client: MagicMock,
+    mock_bluetooth_client: StubBluetoothClient,
+    method: str,
+    args: tuple[Any, ...],
+    command: str,
+    model_code: ModelCode,
+    widget: WidgetType,
+    attribute: str,
+    initial: Any,
+    expected: Any,
 ) -> None:
-    """Test that set_steam_level updates dashboard on success."""
-    mock_bluetooth_client.set_temp = AsyncMock(
-        return_value=BluetoothCommandStatus(
-            id="ble", message="Setting Temperature Success", status="success"
-        )
-    )
-
-    # Call set_steam_level which uses set_temp for steam boiler
-    result = await mock_machine_with_dashboard.set_steam_level(SteamTargetLevel.LEVEL_3)
-
-    assert result is True
-    steam_level = cast(
-        SteamBoilerLevel,
-        mock_machine_with_dashboard.dashboard.config[
-            WidgetType.CM_STEAM_BOILER_LEVEL
-        ],
-    )
-    assert steam_level.target_level == SteamTargetLevel.LEVEL_3
+    """Test that a successful bluetooth command updates the dashboard."""
+    config = mock_machine_with_dashboard.dashboard.config
+    mock_machine_with_dashboard.dashboard.model_code = model_code
+    setattr(config[widget], attribute, initial)
 
-async def test_set_steam_temp_updates_dashboard(
-    mock_machine_with_dashboard: LaMarzoccoMachine,
-    mock_bluetooth_client: MagicMock,
-    snapshot: SnapshotAssertion,
-) -> None:
-    """Test that set_steam_target_temperature updates dashboard on success."""
-    mock_machine_with_dashboard.dashboard.model_code = ModelCode.GS3
-    mock_bluetooth_client.set_temp = AsyncMock(
-        return_value=BluetoothCommandStatus(
-            id="ble", message="Setting Temperature Success", status="success"
-        )
-    )
+    setattr(mock_bluetooth_client, command, async_return(_SUCCESS))
 
-    result = await mock_machine_with_dashboard.set_steam_target_temperature(122.5)
+    result = await getattr(mock_machine_with_dashboard, method)(*args)
 
     assert result is True
-    steam_boiler = cast(
-        SteamBoilerTemperature,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_STEAM_BOILER_TEMPERATURE],
-    )
-    assert steam_boiler.target_temperature == 122.5
-    assert steam_boiler.to_dict() == snapshot
-
+    assert getattr(config[widget], attribute) == expected
+
+
+@pytest.mark.parametrize(
+    ("method", "args", "command", "status", "exception", "widget", "attribute"),
+    [
+        pytest.param(
+            "set_power",
+            (True,),
+            "set_power",
+            _ERROR,
+            None,
+            WidgetType.CM_MACHINE_STATUS,
+            "mode",
+            id="error_status",
+        ),
+        pytest.param(
+            "set_coffee_target_temperature",
+            (96.5,),
+            "set_temp",
+            None,
+            BluetoothConnectionFailed,
+            WidgetType.CM_COFFEE_BOILER,
+            "target_temperature",
+            id="bluetooth_exception",
+        ),
+    ],
+)
 async def test_failed_command_does_not_update_dashboard(
     mock_machine_with_dashboard: LaMarzoccoMachine,
-    mock_bluetooth_client: MagicMock,
+    mock_bluetooth_client: StubBluetoothClient,
+    method: str,
+    args: tuple[Any, ...],
+    command: str,
+    status: BluetoothCommandStatus | None,
+    exception: type[Exception] | None,
+    widget: WidgetType,
+    attribute: str,
 ) -> None:
     """Test that failed commands don't update dashboard."""
-    machine_status_orig = cast(
-        MachineStatus,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_MACHINE_STATUS],
-    )
-    original_mode = machine_status_orig.mode
-
-    mock_bluetooth_client.set_power = AsyncMock(
-        return_value=BluetoothCommandStatus(id="ble", message="Failed", status="error")
-    )
-
-    result = await mock_machine_with_dashboard.set_power(True)
+    config = mock_machine_with_dashboard.dashboard.config
+    original = getattr(config[widget], attribute)
 
-    # Command returns False but doesn't raise exception
-    assert result is False
-    # Dashboard should not be updated
-    machine_status = cast(
-        MachineStatus,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_MACHINE_STATUS],
-    )
-    assert machine_status.mode == original_mode
-
-
-async def test_bluetooth_exception_does_not_update_dashboard(
-    mock_machine_with_dashboard: LaMarzoccoMachine,
-    mock_bluetooth_client: MagicMock,
-) -> None:
-    """Test that Bluetooth exceptions don't update dashboard."""
-    coffee_boiler_orig = cast(
-        CoffeeBoiler,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_COFFEE_BOILER],
+    response = AsyncMock(
+        return_value=status,
+        side_effect=exception("Connection lost") if exception else None,
     )
-    original_temp = coffee_boiler_orig.target_temperature
+    setattr(mock_bluetooth_client, command, response)
 
-    mock_bluetooth_client.set_temp = AsyncMock(
-        side_effect=BluetoothConnectionFailed("Connection lost")
-    )
-
-    # This will fail and return False (no cloud client)
-    result = await mock_machine_with_dashboard.set_coffee_target_temperature(96.5)
+    # Command returns False but doesn't raise, there is no cloud to fall back to
+    result = await getattr(mock_machine_with_dashboard, method)(*args)
 
     assert result is False
+    response.assert_awaited_once()
     # Dashboard should not be updated
-    coffee_boiler = cast(
-        CoffeeBoiler,
-        mock_machine_with_dashboard.dashboard.config[WidgetType.CM_COFFEE_BOILER],
-    )
-    assert coffee_boiler.target_temperature == original_temp
+    assert getattr(config[widget], attribute) == original
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+import json
+from collections.abc import AsyncGenerator
+from functools import cache
 from http import HTTPMethod
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from aiohttp import ClientSession
 from aioresponses import aioresponses
-from cryptography.hazmat.primitives.asymmetric.ec import SECP256R1, generate_private_key
 from syrupy import SnapshotAssertion
 from yarl import URL
 
@@ -38,20 +41,69 @@ from pylamarzocco.util import InstallationKey
 
 from .conftest import load_fixture
 
-MOCK_COMMAND_RESPONSE = [
-    {
-        "id": "mock-id",
-        "status": "Pending",
-        "error_code": None,
-    }
-]
-
-MOCK_SECRET_DATA = InstallationKey(
-    secret=bytes(32),
-    private_key=generate_private_key(SECP256R1()),
-    installation_id="mock-installation-id",
+MOCK_COMMAND_RESPONSE = json.dumps(
+    [
+        {
+            "id": "mock-id",
+            "status": "Pending",
+            "error_code": None,
+        }
+    ]
 )
 
+WAKE_UP_SCHEDULE_BODY = {
+    "enabled": True,
+    "onTimeMinutes": 50,
+    "offTimeMinutes": 1439,
+    "days": [
+        "Monday",
+        "Friday",
+    ],
+    "steamBoiler": False,
+}
+
+
+@cache
+def _url(url: str) -> URL:
+    """Return the parsed URL used to look up recorded requests."""
+    return URL(url)
+
+
+@cache
+def _command_url(serial: str, command: str) -> str:
+    """Return the cloud URL for a command sent to a thing."""
+    return f"{CUSTOMER_APP_URL}/things/{serial}/command/{command}"
+
+
+def _mock_command(mock_aioresponse: aioresponses, serial: str, command: str) -> str:
+    """Register a pending response for a command and return its URL."""
+    url = _command_url(serial, command)
+    mock_aioresponse.post(url=url, status=200, body=MOCK_COMMAND_RESPONSE)
+    return url
+
+
+def _assert_command(
+    mock_aioresponse: aioresponses, url: str, expected_json: dict[str, Any]
+) -> None:
+    """Assert the body of the first command posted to a URL."""
+    call = mock_aioresponse.requests[(HTTPMethod.POST, _url(url))][0]
+    assert call.kwargs["json"] == expected_json
+
+
+@pytest.fixture(name="cloud_client")
+async def lm_cloud_client(
+    installation_key: InstallationKey,
+) -> AsyncGenerator[LaMarzoccoCloudClient]:
+    """Return a cloud client whose HTTP session is closed after the test."""
+    async with ClientSession() as session:
+        yield LaMarzoccoCloudClient("test", "test", installation_key, client=session)
+
+
+@pytest.fixture(name="dashboard_payload")
+def machine_dashboard_payload(request: pytest.FixtureRequest) -> dict[str, Any]:
+    """Return the dashboard fixture for the parametrized machine model."""
+    return load_fixture("machine", f"dashboard_{request.param}.json")
+
 
 @pytest.fixture(name="mock_ws_command_response")
 def websocket_command_response() -> CommandResponse:
@@ -65,35 +117,38 @@ def websocket_command_response() -> CommandResponse:
 @pytest.fixture(name="mock_wait_for_ws_command_response")
 def wait_for_ws_command_response(
     mock_ws_command_response: CommandResponse,
-) -> Generator[AsyncMock]:
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncMock:
     """Mock the wait for."""
-    with patch(
-        "pylamarzocco.clients._cloud.wait_for",
-        new=AsyncMock(return_value=mock_ws_command_response),
-    ) as mock_wait_for:
-        yield mock_wait_for
+    mock_wait_for = AsyncMock(return_value=mock_ws_command_response)
+    monkeypatch.setattr("pylamarzocco.clients._cloud.wait_for", mock_wait_for)
+    return mock_wait_for
 
 
 @pytest.fixture(name="mock_websocket")
-def websocket_mock() -> Generator[MagicMock]:
+def websocket_mock(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     """Return a mocked websocket"""
     mock_ws = MagicMock()
     mock_ws.connected = True
 
-    with patch("pylamarzocco.clients._cloud.WebSocketDetails", return_value=mock_ws):
-        yield mock_ws
+    monkeypatch.setattr(
+        "pylamarzocco.clients._cloud.WebSocketDetails", MagicMock(return_value=mock_ws)
+    )
+    return mock_ws
 
 
-async def test_access_token(mock_aioresponse: aioresponses) -> None:
-    """Test getting the dashboard for a thing."""
+async def test_access_token(
+    mock_aioresponse: aioresponses,
+    cloud_client: LaMarzoccoCloudClient,
+) -> None:
+    """Test signing in to get an access token."""
 
+    url = f"{CUSTOMER_APP_URL}/auth/signin"
+    # drop the autouse sign-in mock so the response below is the one returned
+    mock_aioresponse.clear()
     mock_aioresponse.post(
-        url=f"{CUSTOMER_APP_URL}/auth/signin",
+        url=url,
         status=200,
-        body={
-            "username": "test",
-            "password": "test",
-        },
         payload={
             "id": "mock-id",
             "accessToken": "mock-access",
@@ -104,29 +159,56 @@ async def test_access_token(mock_aioresponse: aioresponses) -> None:
         },
     )
 
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.async_get_access_token()
+    result = await cloud_client.async_get_access_token()
     assert result == "mock-access"
 
-    # now get one again to get from cache
+    call = mock_aioresponse.requests[(HTTPMethod.POST, _url(url))][0]
+    assert call.kwargs["json"] == {"username": "test", "password": "test"}
+
+
+async def test_access_token_cached(
+    mock_aioresponse: aioresponses,
+    cloud_client: LaMarzoccoCloudClient,
+) -> None:
+    """Test that a valid access token is returned from the cache."""
+
+    url = f"{CUSTOMER_APP_URL}/auth/signin"
+    # drop the autouse sign-in mock so a second sign-in would get a new token
+    mock_aioresponse.clear()
     mock_aioresponse.post(
-        url=f"{CUSTOMER_APP_URL}/auth/signin",
+        url=url,
         status=200,
         payload={
-            "accessToken": "new-new-token",
+            "accessToken": "mock-access",
             "refreshToken": "mock-refresh",
         },
     )
-    result = await client.async_get_access_token()
-    assert result == "mock-access"
-
-    # now get one from refresh token
     mock_aioresponse.post(
-        url=f"{CUSTOMER_APP_URL}/auth/refreshtoken",
-        body={
-            "username": "test",
+        url=url,
+        status=200,
+        payload={
+            "accessToken": "new-new-token",
             "refreshToken": "mock-refresh",
         },
+    )
+
+    assert await cloud_client.async_get_access_token() == "mock-access"
+    assert await cloud_client.async_get_access_token() == "mock-access"
+    assert len(mock_aioresponse.requests[(HTTPMethod.POST, _url(url))]) == 1
+
+
+async def test_access_token_refresh(
+    mock_aioresponse: aioresponses,
+    monkeypatch: pytest.MonkeyPatch,
+    cloud_client: LaMarzoccoCloudClient,
+) -> None:
+    """Test refreshing an access token that is about to expire."""
+
+    await cloud_client.async_get_access_token()
+
+    url = f"{CUSTOMER_APP_URL}/auth/refreshtoken"
+    mock_aioresponse.post(
+        url=url,
         payload={
             "accessToken": "new-token",
             "refreshToken": "new-refresh",
@@ -134,35 +216,42 @@ async def test_access_token(mock_aioresponse: aioresponses) -> None:
         },
     )
 
-    with patch("pylamarzocco.clients._cloud.TOKEN_TIME_TO_REFRESH", new=432001):
-        result = await client.async_get_access_token()
+    monkeypatch.setattr("pylamarzocco.clients._cloud.TOKEN_TIME_TO_REFRESH", 432001)
+    result = await cloud_client.async_get_access_token()
 
     assert result == "new-token"
+    call = mock_aioresponse.requests[(HTTPMethod.POST, _url(url))][0]
+    assert call.kwargs["json"] == {"username": "test", "refreshToken": "mock-refresh"}
 
 
-@pytest.mark.parametrize("model", ["micra", "gs3av", "mini", "minir", "stradax"])
+@pytest.mark.parametrize(
+    "dashboard_payload",
+    ["micra", "gs3av", "mini", "minir", "stradax"],
+    indirect=True,
+)
 async def test_get_thing_dashboard(
     mock_aioresponse: aioresponses,
-    model: str,
+    dashboard_payload: dict[str, Any],
     serial: str,
     snapshot: SnapshotAssertion,
+    cloud_client: LaMarzoccoCloudClient,
 ) -> None:
     """Test getting the dashboard for a thing."""
 
     mock_aioresponse.get(
         url=f"{CUSTOMER_APP_URL}/things/{serial}/dashboard",
         status=200,
-        payload=load_fixture("machine", f"dashboard_{model}.json"),
+        payload=dashboard_payload,
     )
 
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.get_thing_dashboard(serial)
+    result = await cloud_client.get_thing_dashboard(serial)
     assert result.to_dict() == snapshot
 
 
 async def test_get_grinder_dashboard(
     mock_aioresponse: aioresponses,
     snapshot: SnapshotAssertion,
+    cloud_client: LaMarzoccoCloudClient,
 ) -> None:
     """Test getting the dashboard for a grinder."""
 
@@ -173,13 +262,15 @@ async def test_get_grinder_dashboard(
         payload=load_fixture("grinder", "dashboard_pico.json"),
     )
 
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.get_thing_dashboard(serial)
+    result = await cloud_client.get_thing_dashboard(serial)
     assert result.to_dict() == snapshot
 
 
 async def test_get_thing_settings(
-    mock_aioresponse: aioresponses, serial: str, snapshot: SnapshotAssertion
+    mock_aioresponse: aioresponses,
+    serial: str,
+    snapshot: SnapshotAssertion,
+    cloud_client: LaMarzoccoCloudClient,
 ) -> None:
     """Test getting the settings for a thing."""
 
@@ -189,13 +280,15 @@ async def test_get_thing_settings(
         payload=load_fixture("machine", "settings_micra.json"),
     )
 
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.get_thing_settings(serial)
+    result = await cloud_client.get_thing_settings(serial)
     assert result.to_dict() == snapshot
 
 
 async def test_get_thing_schedule(
-    mock_aioresponse: aioresponses, serial: str, snapshot: SnapshotAssertion
+    mock_aioresponse: aioresponses,
+    serial: str,
+    snapshot: SnapshotAssertion,
+    cloud_client: LaMarzoccoCloudClient,
 ) -> None:
     """Test getting the schedule for a thing."""
 
@@ -205,13 +298,14 @@ async def test_get_thing_schedule(
         payload=load_fixture("machine", "schedule.json"),
     )
 
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.get_thing_schedule(serial)
+    result = await cloud_client.get_thing_schedule(serial)
     assert result.to_dict() == snapshot
 
 
 async def test_list_things(
-    mock_aioresponse: aioresponses, snapshot: SnapshotAssertion
+    mock_aioresponse: aioresponses,
+    snapshot: SnapshotAssertion,
+    cloud_client: LaMarzoccoCloudClient,
 ) -> None:
     """Test getting the list of things."""
 
@@ -221,13 +315,15 @@ async def test_list_things(
         payload=[load_fixture("machine", "settings_micra.json")],
     )
 
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.list_things()
+    result = await cloud_client.list_things()
     assert result[0].to_dict() == snapshot
 
 
 async def test_get_statistics(
-    mock_aioresponse: aioresponses, serial: str, snapshot: SnapshotAssertion
+    mock_aioresponse: aioresponses,
+    serial: str,
+    snapshot: SnapshotAssertion,
+    cloud_client: LaMarzoccoCloudClient,
 ) -> None:
     """Test getting the list of things."""
 
@@ -237,42 +333,19 @@ async def test_get_statistics(
         payload=load_fixture("machine", "statistics.json"),
     )
 
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.get_thing_statistics(serial)
+    result = await cloud_client.get_thing_statistics(serial)
     assert result.to_dict() == snapshot
 
 
-async def test_set_power(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the power for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineChangeMode"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_power(serial, False)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"mode": "StandBy"}
-    assert result is True
-
-
 async def test_disconnected_commands_do_not_leak_pending(
     mock_aioresponse: aioresponses,
     serial: str,
+    cloud_client: LaMarzoccoCloudClient,
 ) -> None:
     """Fire-and-forget commands (websocket disconnected) must not accumulate
-    in _pending_commands. """
+    in _pending_commands."""
 
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineChangeMode"
+    url = _command_url(serial, "CoffeeMachineChangeMode")
 
     for i in range(5):
         mock_aioresponse.post(
@@ -281,996 +354,442 @@ async def test_disconnected_commands_do_not_leak_pending(
             payload=[{"id": f"cmd-{i}", "status": "Pending", "error_code": None}],
         )
 
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    assert client.websocket.connected is False
+    assert cloud_client.websocket.connected is False
 
     for _ in range(5):
-        assert await client.set_power(serial, False) is True
+        assert await cloud_client.set_power(serial, False) is True
 
-    requests = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))]
+    requests = mock_aioresponse.requests[(HTTPMethod.POST, _url(url))]
     assert len(requests) == 5
     for call in requests:
         assert call.kwargs["json"] == {"mode": "StandBy"}
 
-    assert client._pending_commands == {}
+    assert cloud_client._pending_commands == {}
 
 
-@pytest.mark.usefixtures("mock_websocket", "mock_wait_for_ws_command_response")
+@pytest.mark.parametrize(
+    ("connected", "ws_status", "side_effect", "expected"),
+    [
+        pytest.param(True, CommandStatus.SUCCESS, None, True, id="success"),
+        pytest.param(True, CommandStatus.ERROR, None, False, id="error"),
+        pytest.param(True, CommandStatus.SUCCESS, TimeoutError, False, id="timeout"),
+        pytest.param(False, CommandStatus.SUCCESS, None, True, id="disconnected"),
+    ],
+)
 async def test_set_power_with_ws_validation(
     mock_aioresponse: aioresponses,
+    mock_websocket: MagicMock,
+    mock_ws_command_response: CommandResponse,
+    mock_wait_for_ws_command_response: AsyncMock,
     serial: str,
+    cloud_client: LaMarzoccoCloudClient,
+    connected: bool,
+    ws_status: CommandStatus,
+    side_effect: type[Exception] | None,
+    expected: bool,
 ) -> None:
     """Test setting the power for a thing, validate the command from ws."""
 
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineChangeMode"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
+    url = _mock_command(mock_aioresponse, serial, "CoffeeMachineChangeMode")
 
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
+    mock_websocket.connected = connected
+    mock_ws_command_response.status = ws_status
+    mock_wait_for_ws_command_response.side_effect = side_effect
 
-    result = await client.set_power(serial, False)
+    result = await cloud_client.set_power(serial, False)
 
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"mode": "StandBy"}
-    assert result is True
+    _assert_command(mock_aioresponse, url, {"mode": "StandBy"})
+    assert result is expected
+    if connected:
+        mock_wait_for_ws_command_response.assert_awaited_once()
+    else:
+        mock_wait_for_ws_command_response.assert_not_awaited()
 
 
-async def test_set_mode(
+@pytest.mark.parametrize(
+    ("command", "method", "args", "expected_json"),
+    [
+        pytest.param(
+            "CoffeeMachineChangeMode",
+            "set_power",
+            (False,),
+            {"mode": "StandBy"},
+            id="set_power",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingSteamBoilerEnabled",
+            "set_steam",
+            (True,),
+            {"boilerIndex": 1, "enabled": True},
+            id="set_steam",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingCoffeeBoilerTargetTemperature",
+            "set_coffee_target_temperature",
+            (94.584,),
+            {"boilerIndex": 1, "targetTemperature": 94.6},
+            id="set_coffee_target_temperature",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingSteamBoilerTargetLevel",
+            "set_steam_target_level",
+            (SteamTargetLevel.LEVEL_1,),
+            {"boilerIndex": 1, "targetLevel": "Level1"},
+            id="set_steam_target_level",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingSteamBoilerTargetTemperature",
+            "set_steam_target_temperature",
+            (122.1,),
+            {"boilerIndex": 1, "targetTemperature": 122.1},
+            id="set_steam_target_temperature",
+        ),
+        pytest.param(
+            "CoffeeMachineBackFlushStartCleaning",
+            "start_backflush_cleaning",
+            (),
+            {"enabled": True},
+            id="start_backflush_cleaning",
+        ),
+        pytest.param(
+            "CoffeeMachinePreBrewingChangeMode",
+            "change_pre_extraction_mode",
+            (PreExtractionMode.PREBREWING,),
+            {"mode": "PreBrewing"},
+            id="change_pre_extraction_mode",
+        ),
+        pytest.param(
+            "CoffeeMachinePreBrewingSettingTimes",
+            "change_pre_extraction_times",
+            (
+                PrebrewSettingTimes(
+                    times=SecondsInOut(seconds_in=5.12, seconds_out=5.03)
+                ),
+            ),
+            {
+                "times": {"In": 5.1, "Out": 5.0},
+                "groupIndex": 1,
+                "doseIndex": "ByGroup",
+            },
+            id="change_pre_extraction_times",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingSmartStandBy",
+            "set_smart_standby",
+            (False, 20, SmartStandByType.LAST_BREW),
+            {"enabled": False, "minutes": 20, "after": "LastBrewing"},
+            id="set_smart_standby",
+        ),
+        pytest.param(
+            "CoffeeMachineChangeMode",
+            "set_mode",
+            (MachineMode.ECO_MODE,),
+            {"mode": "EcoMode"},
+            id="set_mode",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingAutoFlushEnabled",
+            "set_auto_flush",
+            (True,),
+            {"enabled": True},
+            id="set_auto_flush",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingSteamFlushEnabled",
+            "set_steam_flush",
+            (False,),
+            {"enabled": False},
+            id="set_steam_flush",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingRinseFlushEnabled",
+            "set_rinse_flush",
+            (True,),
+            {"enabled": True},
+            id="set_rinse_flush",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingHotWaterDoseEnabled",
+            "set_hot_water_dose_enabled",
+            (False,),
+            {"enabled": False},
+            id="set_hot_water_dose_enabled",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingCupWarmerEnabled",
+            "set_cup_warmer",
+            (True,),
+            {"enabled": True},
+            id="set_cup_warmer",
+        ),
+        pytest.param(
+            "CoffeeMachineGroupChangeMode",
+            "set_group_mode",
+            (MachineMode.BREWING_MODE,),
+            {"groupIndex": 1, "mode": "BrewingMode"},
+            id="set_group_mode",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingCoffeeBoilerEnabled",
+            "set_coffee_boiler",
+            (True,),
+            {"boilerIndex": 1, "enabled": True},
+            id="set_coffee_boiler",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingRinseFlushTime",
+            "set_rinse_flush_time",
+            (4.0,),
+            {"timeSeconds": 4.0},
+            id="set_rinse_flush_time",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingHotWaterDose",
+            "set_hot_water_dose",
+            (8.0, DoseIndex.DOSE_A),
+            {"doseIndex": "DoseA", "dose": 8.0},
+            id="set_hot_water_dose",
+        ),
+        pytest.param(
+            "CoffeeMachineGroupDoseChangeMode",
+            "set_group_dose_mode",
+            (DoseMode.PULSES_TYPE,),
+            {"groupIndex": 1, "mode": "PulsesType"},
+            id="set_group_dose_mode",
+        ),
+        pytest.param(
+            "CoffeeMachineGroupDoseSettingDose",
+            "set_group_dose",
+            (DoseMode.PULSES_TYPE, DoseIndex.DOSE_A, 36.0),
+            {
+                "groupIndex": 1,
+                "mode": "PulsesType",
+                "doseIndex": "DoseA",
+                "dose": 36.0,
+            },
+            id="set_group_dose",
+        ),
+        pytest.param(
+            "CoffeeMachineGroupDoseSettingGroupBrewingPressure",
+            "set_brewing_pressure",
+            (9.0,),
+            {"groupIndex": 1, "pressure": 9.0},
+            id="set_brewing_pressure",
+        ),
+        pytest.param(
+            "CoffeeMachineGroupDoseSettingContinuousDoseEnabled",
+            "set_continuous_dose_enabled",
+            (True,),
+            {"groupIndex": 1, "rinseEnabled": True},
+            id="set_continuous_dose_enabled",
+        ),
+        pytest.param(
+            "CoffeeMachineGroupDoseSettingContinuousDose",
+            "set_continuous_dose",
+            (3.0,),
+            {"groupIndex": 1, "rinseSeconds": 3.0},
+            id="set_continuous_dose",
+        ),
+        pytest.param(
+            "CoffeeMachineGroupDoseSettingMirrorGroup1",
+            "set_mirror_group1",
+            (True,),
+            {"groupIndex": 2, "enabled": True},
+            id="set_mirror_group1",
+        ),
+        pytest.param(
+            "CoffeeMachineSettingPlumbIn",
+            "set_plumb_in",
+            (True,),
+            {"enabled": True},
+            id="set_plumb_in",
+        ),
+        pytest.param(
+            "GrinderChangeMode",
+            "set_grinder_mode",
+            (GrinderMode.GRINDING,),
+            {"mode": "GrindingMode"},
+            id="set_grinder_mode",
+        ),
+        pytest.param(
+            "GrinderSettingBaristaLightEnabled",
+            "set_grinder_barista_light",
+            (True,),
+            {"index": 1, "enabled": True},
+            id="set_grinder_barista_light",
+        ),
+        pytest.param(
+            "GrinderSettingGrindWithMode",
+            "set_grinder_grind_with",
+            (GrinderGrindWithMode.BY_BUTTON,),
+            {"index": 1, "mode": "ByButton"},
+            id="set_grinder_grind_with",
+        ),
+        pytest.param(
+            "GrinderSettingDose",
+            "set_grinder_dose",
+            (DoseIndex.DOSE_A, 12.0, GrinderDoseMode.REV, GrinderSpeedLevelType.HIGH),
+            {
+                "index": 1,
+                "mode": "RevType",
+                "doseIndex": "DoseA",
+                "dose": 12.0,
+                "speedLevel": "High",
+            },
+            id="set_grinder_dose",
+        ),
+        pytest.param(
+            "GrinderSettingDose",
+            "set_grinder_dose",
+            (DoseIndex.DOSE_B, 9.7, GrinderDoseMode.REV),
+            {
+                "index": 1,
+                "mode": "RevType",
+                "doseIndex": "DoseB",
+                "dose": 9.7,
+            },
+            id="set_grinder_dose_without_speed",
+        ),
+        pytest.param(
+            "GrinderSettingMoreDose",
+            "set_grinder_more_dose",
+            (2.5,),
+            {"index": 1, "revolutions": 2.5},
+            id="set_grinder_more_dose",
+        ),
+        pytest.param(
+            "CoffeeMachineBrewByWeightChangeMode",
+            "change_brew_by_weight_dose_mode",
+            (DoseMode.DOSE_1,),
+            {"mode": "Dose1"},
+            id="change_brew_by_weight_dose_mode",
+        ),
+        pytest.param(
+            "CoffeeMachineBrewByWeightSettingDoses",
+            "set_brew_by_weight_dose",
+            (32.56, 45.67),
+            {
+                "doses": {
+                    "Dose1": 32.6,
+                    "Dose2": 45.7,
+                }
+            },
+            id="set_brew_by_weight_dose",
+        ),
+    ],
+)
+async def test_command(
     mock_aioresponse: aioresponses,
     serial: str,
+    cloud_client: LaMarzoccoCloudClient,
+    command: str,
+    method: str,
+    args: tuple[object, ...],
+    expected_json: dict[str, object],
 ) -> None:
-    """Test setting the operating mode for a thing."""
+    """Test that a command posts the expected body."""
 
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineChangeMode"
+    url = _mock_command(mock_aioresponse, serial, command)
 
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
+    result = await getattr(cloud_client, method)(serial, *args)
 
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_mode(serial, MachineMode.ECO_MODE)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"mode": "EcoMode"}
+    _assert_command(mock_aioresponse, url, expected_json)
     assert result is True
 
 
-async def test_set_auto_flush(
+async def test_set_wake_up_schedule(
     mock_aioresponse: aioresponses,
     serial: str,
+    cloud_client: LaMarzoccoCloudClient,
 ) -> None:
-    """Test enabling auto flush for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingAutoFlushEnabled"
+    """Test setting the wake up schedule for a thing."""
 
+    url = _command_url(serial, "CoffeeMachineSettingWakeUpSchedule")
     mock_aioresponse.post(
         url=url,
         status=200,
-        payload=MOCK_COMMAND_RESPONSE,
+        body=MOCK_COMMAND_RESPONSE,
+        repeat=2,
     )
 
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_auto_flush(serial, True)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"enabled": True}
-    assert result is True
-
-
-async def test_set_steam_flush(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test enabling steam flush for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingSteamFlushEnabled"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
+    # new schedule
+    result = await cloud_client.set_wakeup_schedule(
+        serial,
+        WakeUpScheduleSettings(
+            enabled=True,
+            on_time_minutes=50,
+            off_time_minutes=1439,
+            steam_boiler=False,
+            days=[WeekDay.MONDAY, WeekDay.FRIDAY],
+        ),
     )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_steam_flush(serial, False)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"enabled": False}
+    call = mock_aioresponse.requests[(HTTPMethod.POST, _url(url))][0]
+    assert call.kwargs["json"] == WAKE_UP_SCHEDULE_BODY
     assert result is True
 
-
-async def test_set_rinse_flush(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test enabling rinse flush for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingRinseFlushEnabled"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
+    # existing schedule
+    result = await cloud_client.set_wakeup_schedule(
+        serial,
+        WakeUpScheduleSettings(
+            identifier="aBc23d",
+            enabled=True,
+            on_time_minutes=50,
+            off_time_minutes=1439,
+            steam_boiler=False,
+            days=[WeekDay.MONDAY, WeekDay.FRIDAY],
+        ),
     )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_rinse_flush(serial, True)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"enabled": True}
+    call = mock_aioresponse.requests[(HTTPMethod.POST, _url(url))][1]
+    assert call.kwargs["json"] == {
+        "id": "aBc23d",
+        **WAKE_UP_SCHEDULE_BODY,
+    }
     assert result is True
 
 
-async def test_set_hot_water_dose_enabled(
+async def test_get_update_details(
     mock_aioresponse: aioresponses,
     serial: str,
+    snapshot: SnapshotAssertion,
+    cloud_client: LaMarzoccoCloudClient,
 ) -> None:
-    """Test enabling the hot water dose for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingHotWaterDoseEnabled"
+    """Test getting the update details for a thing."""
 
-    mock_aioresponse.post(
+    url = f"{CUSTOMER_APP_URL}/things/{serial}/update-fw"
+    mock_aioresponse.get(
         url=url,
         status=200,
-        payload=MOCK_COMMAND_RESPONSE,
+        payload={
+            "status": "ToUpdate",
+            "commandStatus": "InProgress",
+            "progressInfo": "download",
+            "progressPercentage": 10,
+        },
     )
 
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_hot_water_dose_enabled(serial, False)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"enabled": False}
-    assert result is True
+    result = await cloud_client.get_thing_firmware(serial)
+    assert result.to_dict() == snapshot
 
 
-async def test_set_cup_warmer(
+async def test_start_update(
     mock_aioresponse: aioresponses,
     serial: str,
+    snapshot: SnapshotAssertion,
+    cloud_client: LaMarzoccoCloudClient,
 ) -> None:
-    """Test enabling the cup warmer for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingCupWarmerEnabled"
+    """Test getting the update details for a thing."""
 
+    url = f"{CUSTOMER_APP_URL}/things/{serial}/update-fw"
     mock_aioresponse.post(
         url=url,
         status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_cup_warmer(serial, True)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"enabled": True}
-    assert result is True
-
-
-async def test_set_group_mode(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the mode of a single group."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineGroupChangeMode"
-
-    mock_aioresponse.post(url=url, status=200, payload=MOCK_COMMAND_RESPONSE)
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_group_mode(serial, MachineMode.BREWING_MODE)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"groupIndex": 1, "mode": "BrewingMode"}
-    assert result is True
-
-
-async def test_set_coffee_boiler(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test enabling the coffee boiler."""
-
-    url = (
-        f"{CUSTOMER_APP_URL}/things/{serial}/command/"
-        "CoffeeMachineSettingCoffeeBoilerEnabled"
+        payload={
+            "status": "ToUpdate",
+            "commandStatus": "InProgress",
+            "progressInfo": "starting process",
+            "progressPercentage": None,
+        },
     )
 
-    mock_aioresponse.post(url=url, status=200, payload=MOCK_COMMAND_RESPONSE)
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_coffee_boiler(serial, True)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"boilerIndex": 1, "enabled": True}
-    assert result is True
-
-
-async def test_set_rinse_flush_time(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the rinse flush time."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingRinseFlushTime"
-
-    mock_aioresponse.post(url=url, status=200, payload=MOCK_COMMAND_RESPONSE)
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_rinse_flush_time(serial, 4.0)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"timeSeconds": 4.0}
-    assert result is True
-
-
-async def test_set_hot_water_dose(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting a hot water dose value."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingHotWaterDose"
-
-    mock_aioresponse.post(url=url, status=200, payload=MOCK_COMMAND_RESPONSE)
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_hot_water_dose(serial, 8.0, DoseIndex.DOSE_A)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"doseIndex": "DoseA", "dose": 8.0}
-    assert result is True
-
-
-async def test_set_group_dose_mode(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the dose mode of a group."""
-
-    url = (
-        f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineGroupDoseChangeMode"
-    )
-
-    mock_aioresponse.post(url=url, status=200, payload=MOCK_COMMAND_RESPONSE)
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_group_dose_mode(serial, DoseMode.PULSES_TYPE)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"groupIndex": 1, "mode": "PulsesType"}
-    assert result is True
-
-
-async def test_set_group_dose(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting a group dose value."""
-
-    url = (
-        f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineGroupDoseSettingDose"
-    )
-
-    mock_aioresponse.post(url=url, status=200, payload=MOCK_COMMAND_RESPONSE)
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_group_dose(
-        serial, DoseMode.PULSES_TYPE, DoseIndex.DOSE_A, 36.0
-    )
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {
-        "groupIndex": 1,
-        "mode": "PulsesType",
-        "doseIndex": "DoseA",
-        "dose": 36.0,
-    }
-    assert result is True
-
-
-async def test_set_brewing_pressure(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the brewing pressure of a group."""
-
-    url = (
-        f"{CUSTOMER_APP_URL}/things/{serial}/command/"
-        "CoffeeMachineGroupDoseSettingGroupBrewingPressure"
-    )
-
-    mock_aioresponse.post(url=url, status=200, payload=MOCK_COMMAND_RESPONSE)
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_brewing_pressure(serial, 9.0)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"groupIndex": 1, "pressure": 9.0}
-    assert result is True
-
-
-async def test_set_continuous_dose_enabled(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test enabling the continuous dose of a group."""
-
-    url = (
-        f"{CUSTOMER_APP_URL}/things/{serial}/command/"
-        "CoffeeMachineGroupDoseSettingContinuousDoseEnabled"
-    )
-
-    mock_aioresponse.post(url=url, status=200, payload=MOCK_COMMAND_RESPONSE)
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_continuous_dose_enabled(serial, True)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"groupIndex": 1, "rinseEnabled": True}
-    assert result is True
-
-
-async def test_set_continuous_dose(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the continuous dose duration of a group."""
-
-    url = (
-        f"{CUSTOMER_APP_URL}/things/{serial}/command/"
-        "CoffeeMachineGroupDoseSettingContinuousDose"
-    )
-
-    mock_aioresponse.post(url=url, status=200, payload=MOCK_COMMAND_RESPONSE)
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_continuous_dose(serial, 3.0)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"groupIndex": 1, "rinseSeconds": 3.0}
-    assert result is True
-
-
-async def test_set_mirror_group1(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test mirroring a group with group 1."""
-
-    url = (
-        f"{CUSTOMER_APP_URL}/things/{serial}/command/"
-        "CoffeeMachineGroupDoseSettingMirrorGroup1"
-    )
-
-    mock_aioresponse.post(url=url, status=200, payload=MOCK_COMMAND_RESPONSE)
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_mirror_group1(serial, True)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"groupIndex": 2, "enabled": True}
-    assert result is True
-
-
-async def test_set_plumb_in(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test enabling plumb-in mode."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingPlumbIn"
-
-    mock_aioresponse.post(url=url, status=200, payload=MOCK_COMMAND_RESPONSE)
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_plumb_in(serial, True)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"enabled": True}
-    assert result is True
-
-
-@pytest.mark.usefixtures("mock_websocket", "mock_wait_for_ws_command_response")
-async def test_set_grinder_mode(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the mode (wake/standby) for a grinder."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/GrinderChangeMode"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_grinder_mode(serial, GrinderMode.GRINDING)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"mode": "GrindingMode"}
-    assert result is True
-
-
-@pytest.mark.usefixtures("mock_websocket", "mock_wait_for_ws_command_response")
-async def test_set_grinder_barista_light(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the barista light for a grinder."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/GrinderSettingBaristaLightEnabled"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_grinder_barista_light(serial, True)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"index": 1, "enabled": True}
-    assert result is True
-
-
-async def test_set_grinder_grind_with(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the grind-with mode for a grinder."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/GrinderSettingGrindWithMode"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_grinder_grind_with(
-        serial, GrinderGrindWithMode.BY_BUTTON
-    )
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"index": 1, "mode": "ByButton"}
-    assert result is True
-
-
-async def test_set_grinder_dose(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the dose and speed level for a grinder."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/GrinderSettingDose"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_grinder_dose(
-        serial,
-        DoseIndex.DOSE_A,
-        12.0,
-        GrinderDoseMode.REV,
-        GrinderSpeedLevelType.HIGH,
-    )
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {
-        "index": 1,
-        "mode": "RevType",
-        "doseIndex": "DoseA",
-        "dose": 12.0,
-        "speedLevel": "High",
-    }
-    assert result is True
-
-
-async def test_set_grinder_dose_without_speed(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the dose without a speed level for a grinder."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/GrinderSettingDose"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_grinder_dose(
-        serial, DoseIndex.DOSE_B, 9.7, GrinderDoseMode.REV
-    )
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {
-        "index": 1,
-        "mode": "RevType",
-        "doseIndex": "DoseB",
-        "dose": 9.7,
-    }
-    assert result is True
-
-
-async def test_set_grinder_more_dose(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the more-dose revolutions for a grinder."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/GrinderSettingMoreDose"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_grinder_more_dose(serial, 2.5)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"index": 1, "revolutions": 2.5}
-    assert result is True
-
-
-@pytest.mark.usefixtures("mock_websocket", "mock_wait_for_ws_command_response")
-async def test_failing_response_ws_validation(
-    mock_aioresponse: aioresponses,
-    mock_ws_command_response: CommandResponse,
-    serial: str,
-) -> None:
-    """Tests failing response from websocket"""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineChangeMode"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    mock_ws_command_response.status = CommandStatus.ERROR
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_power(serial, False)
-    assert result is False
-
-
-@pytest.mark.usefixtures("mock_websocket", "mock_wait_for_ws_command_response")
-async def test_pending_command_ws_validation_timeout(
-    mock_aioresponse: aioresponses,
-    mock_wait_for_ws_command_response: AsyncMock,
-    serial: str,
-) -> None:
-    """Tests failing response from websocket"""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineChangeMode"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    mock_wait_for_ws_command_response.side_effect = TimeoutError
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    result = await client.set_power(serial, False)
-    assert result is False
-
-
-async def test_disconnected_ws_returns_true(
-    mock_aioresponse: aioresponses,
-    mock_websocket: MagicMock,
-    serial: str,
-) -> None:
-    """Test setting the power for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineChangeMode"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    mock_websocket.connected = False
-
-    result = await client.set_power(serial, False)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"mode": "StandBy"}
-    assert result is True
-
-
-async def test_set_steam(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the steam for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingSteamBoilerEnabled"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.set_steam(serial, True)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {
-        "boilerIndex": 1,
-        "enabled": True,
-    }
-    assert result is True
-
-
-async def test_set_coffee_temperature(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the steam for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingCoffeeBoilerTargetTemperature"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.set_coffee_target_temperature(serial, 94.584)
-
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {
-        "boilerIndex": 1,
-        "targetTemperature": 94.6,
-    }
-    assert result is True
-
-
-async def test_set_steam_target_level(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the steam target level for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingSteamBoilerTargetLevel"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.set_steam_target_level(serial, SteamTargetLevel.LEVEL_1)
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {
-        "boilerIndex": 1,
-        "targetLevel": "Level1",
-    }
-    assert result is True
-
-
-async def test_set_steam_target_temperature(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the steam target temperature for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingSteamBoilerTargetTemperature"
-
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.set_steam_target_temperature(serial, 122.1)
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {
-        "boilerIndex": 1,
-        "targetTemperature": 122.1,
-    }
-    assert result is True
-
-
-async def test_start_backflush_cleaning(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test starting backflush cleaning for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineBackFlushStartCleaning"
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.start_backflush_cleaning(serial)
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {
-        "enabled": True,
-    }
-    assert result is True
-
-
-async def test_change_pre_extraction_mode(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test changing the pre-extraction mode for a thing."""
-
-    url = (
-        f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachinePreBrewingChangeMode"
-    )
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.change_pre_extraction_mode(
-        serial, PreExtractionMode.PREBREWING
-    )
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {
-        "mode": "PreBrewing",
-    }
-    assert result is True
-
-
-async def test_change_pre_extraction_times(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test changing the pre-extraction times for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachinePreBrewingSettingTimes"
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.change_pre_extraction_times(
-        serial,
-        PrebrewSettingTimes(times=SecondsInOut(seconds_in=5.12, seconds_out=5.03)),
-    )
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {
-        "times": {"In": 5.1, "Out": 5.0},
-        "groupIndex": 1,
-        "doseIndex": "ByGroup",
-    }
-    assert result is True
-
-
-async def test_setting_smart_standby(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the smart standby for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingSmartStandBy"
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.set_smart_standby(
-        serial, False, 20, SmartStandByType.LAST_BREW
-    )
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {
-        "enabled": False,
-        "minutes": 20,
-        "after": "LastBrewing",
-    }
-    assert result is True
-
-
-async def test_set_wake_up_schedule(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the wake up schedule for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineSettingWakeUpSchedule"
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-        repeat=2,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-
-    # new schedule
-    result = await client.set_wakeup_schedule(
-        serial,
-        WakeUpScheduleSettings(
-            enabled=True,
-            on_time_minutes=50,
-            off_time_minutes=1439,
-            steam_boiler=False,
-            days=[WeekDay.MONDAY, WeekDay.FRIDAY],
-        ),
-    )
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    expected_output = {
-        "enabled": True,
-        "onTimeMinutes": 50,
-        "offTimeMinutes": 1439,
-        "days": [
-            "Monday",
-            "Friday",
-        ],
-        "steamBoiler": False,
-    }
-    assert call.kwargs["json"] == expected_output
-    assert result is True
-
-    # existing schedule
-    result = await client.set_wakeup_schedule(
-        serial,
-        WakeUpScheduleSettings(
-            identifier="aBc23d",
-            enabled=True,
-            on_time_minutes=50,
-            off_time_minutes=1439,
-            steam_boiler=False,
-            days=[WeekDay.MONDAY, WeekDay.FRIDAY],
-        ),
-    )
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][1]
-    assert call.kwargs["json"] == {
-        "id": "aBc23d",
-        **expected_output,
-    }
-    assert result is True
-
-
-async def test_get_update_details(
-    mock_aioresponse: aioresponses, serial: str, snapshot: SnapshotAssertion
-) -> None:
-    """Test getting the update details for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/update-fw"
-    mock_aioresponse.get(
-        url=url,
-        status=200,
-        payload={
-            "status": "ToUpdate",
-            "commandStatus": "InProgress",
-            "progressInfo": "download",
-            "progressPercentage": 10,
-        },
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.get_thing_firmware(serial)
+    result = await cloud_client.update_firmware(serial)
     assert result.to_dict() == snapshot
-
-
-async def test_start_update(
-    mock_aioresponse: aioresponses, serial: str, snapshot: SnapshotAssertion
-) -> None:
-    """Test getting the update details for a thing."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/update-fw"
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload={
-            "status": "ToUpdate",
-            "commandStatus": "InProgress",
-            "progressInfo": "starting process",
-            "progressPercentage": None,
-        },
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.update_firmware(serial)
-    assert result.to_dict() == snapshot
-
-
-async def test_change_brew_by_weight_dose_mode(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test changing the brew by weight dose mode."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineBrewByWeightChangeMode"
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.change_brew_by_weight_dose_mode(serial, DoseMode.DOSE_1)
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {"mode": "Dose1"}
-    assert result is True
-
-
-async def test_set_brew_by_weight_dose(
-    mock_aioresponse: aioresponses,
-    serial: str,
-) -> None:
-    """Test setting the brew by weight doses."""
-
-    url = f"{CUSTOMER_APP_URL}/things/{serial}/command/CoffeeMachineBrewByWeightSettingDoses"
-    mock_aioresponse.post(
-        url=url,
-        status=200,
-        payload=MOCK_COMMAND_RESPONSE,
-    )
-
-    client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
-    result = await client.set_brew_by_weight_dose(serial, 32.56, 45.67)
-    call = mock_aioresponse.requests[(HTTPMethod.POST, URL(url))][0]
-    assert call.kwargs["json"] == {
-        "doses": {
-            "Dose1": 32.6,
-            "Dose2": 45.7,
-        }
-    }
-    assert result is True
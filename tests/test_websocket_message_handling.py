@@ -8,25 +8,17 @@ from pylamarzocco.clients import LaMarzoccoCloudClient
 from pylamarzocco.const import StompMessageType
 from pylamarzocco.util import InstallationKey, encode_stomp_ws_message
 from pylamarzocco.models import WebSocketDetails
-from cryptography.hazmat.primitives.asymmetric.ec import SECP256R1, generate_private_key
-
-
-MOCK_SECRET_DATA = InstallationKey(
-    secret=bytes(32),
-    private_key=generate_private_key(SECP256R1()),
-    installation_id="mock-installation-id",
-)
 
 
 class TestWebSocketMessageHandling:
     """Test websocket message handling functionality."""
 
     @pytest.fixture
-    async def mock_client(self):
+    async def mock_client(self, installation_key: InstallationKey):
         """Create a mocked client with session."""
         mock_session = MagicMock()
         with patch('aiohttp.ClientSession', return_value=mock_session):
-            client = LaMarzoccoCloudClient("test", "test", MOCK_SECRET_DATA)
+            client = LaMarzoccoCloudClient("test", "test", installation_key)
             yield client
 
     async def test_handle_websocket_message_closing(self, mock_client) -> None: